@@ -3,11 +3,13 @@ from typing import Any, Optional, List, Tuple
 
 class Node:
     """Base AST node with optional position tracking"""
+    __slots__ = ('line', 'column')
     def __init__(self, line=None, column=None):
         self.line = line
         self.column = column
 
 class Program(Node):
+    __slots__ = ('statements',)
     def __init__(self, statements):
         super().__init__()
         self.statements = statements
@@ -15,6 +17,7 @@ class Program(Node):
 # ===== Variable Declarations =====
 
 class VarDecl(Node):
+    __slots__ = ('var_type', 'name', 'value', 'is_const', 'is_mut')
     def __init__(self, var_type, name, value, is_const=False, is_mut=True):
         super().__init__()
         self.var_type = var_type  # "uint8", "uint16", etc. or None
@@ -28,12 +31,14 @@ class VarDecl(Node):
         return f"VarDecl({qualifier} {self.var_type}, {self.name}, {self.value})"
 
 class Assignment(Node):
+    __slots__ = ('name', 'value')
     def __init__(self, name, value):
         super().__init__()
         self.name = name
         self.value = value
 
 class AugmentedAssignment(Node):
+    __slots__ = ('name', 'operator', 'value')
     def __init__(self, name, operator, value):
         super().__init__()
         self.name = name
@@ -45,6 +50,7 @@ class AugmentedAssignment(Node):
 
 class DestructuringAssignment(Node):
     """For pattern-based assignment: let (a, b, c) = tuple"""
+    __slots__ = ('pattern', 'value')
     def __init__(self, pattern, value):
         super().__init__()
         self.pattern = pattern  # list of names or nested patterns
@@ -53,31 +59,37 @@ class DestructuringAssignment(Node):
 # ===== Literals =====
 
 class Identifier(Node):
+    __slots__ = ('name',)
     def __init__(self, name):
         super().__init__()
         self.name = name
 
 class Literal(Node):
+    __slots__ = ('value',)
     def __init__(self, value):
         super().__init__()
         self.value = value
 
 class ArrayLiteral(Node):
+    __slots__ = ('elements',)
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
 
 class NullLiteral(Node):
+    __slots__ = ('value',)
     def __init__(self):
         super().__init__()
         self.value = None
 
 class DictLiteral(Node):
+    __slots__ = ('pairs',)
     def __init__(self, pairs):
         super().__init__()
         self.pairs = pairs
 
 class CharLiteral(Node):
+    __slots__ = ('value',)
     def __init__(self, value):
         super().__init__()
         self.value = value  # string, either 1 char or escape like \n
@@ -86,11 +98,13 @@ class CharLiteral(Node):
         return f"CharLiteral({self.value!r})"
     
 class BigIntLiteral(Node):
+    __slots__ = ('value',)
     def __init__(self, value):
         super().__init__()
         self.value = int(value[:-1]) if isinstance(value, str) else value
 
 class SizeIntLiteral(Node):
+    __slots__ = ('expr', 'signed')
     def __init__(self, expr, signed=True):
         super().__init__()
         self.expr = expr
@@ -100,11 +114,13 @@ class SizeIntLiteral(Node):
         return f"{'isize' if self.signed else 'usize'}({self.expr})"
 
 class DecimalLiteral(Node):
+    __slots__ = ('value',)
     def __init__(self, value):
         super().__init__()
         self.value = Decimal(value)
 
 class TupleLiteral(Node):
+    __slots__ = ('elements',)
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
@@ -113,6 +129,7 @@ class TupleLiteral(Node):
         return f"TupleLiteral({self.elements})"
 
 class SetLiteral(Node):
+    __slots__ = ('elements',)
     def __init__(self, elements):
         super().__init__()
         self.elements = elements
@@ -122,6 +139,7 @@ class SetLiteral(Node):
 
 class RangeLiteral(Node):
     """Range literal: 1..10 or 1..=10 (inclusive)"""
+    __slots__ = ('start', 'end', 'inclusive')
     def __init__(self, start, end, inclusive=False):
         super().__init__()
         self.start = start
@@ -130,6 +148,7 @@ class RangeLiteral(Node):
 
 class StringInterpolation(Node):
     """f"Hello {name}" style strings"""
+    __slots__ = ('parts',)
     def __init__(self, parts):
         super().__init__()
         self.parts = parts  # list of strings and expressions
@@ -137,6 +156,7 @@ class StringInterpolation(Node):
 # ===== Integer Types =====
 
 class UIntLiteral(Node):
+    __slots__ = ('value', 'bit_size')
     def __init__(self, value, bit_size):
         super().__init__()
         self.value = value
@@ -146,6 +166,7 @@ class UIntLiteral(Node):
         return f"UIntLiteral({self.value}, {self.bit_size})"
     
 class IntLiteral(Node):
+    __slots__ = ('value', 'bits', 'signed')
     def __init__(self, value, bits, signed):
         super().__init__()
         self.value = value
@@ -153,6 +174,7 @@ class IntLiteral(Node):
         self.signed = signed
 
 class PtrDiffLiteral(Node):
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
@@ -163,13 +185,23 @@ class PtrDiffLiteral(Node):
 # ===== Operators =====
 
 class BinaryOp(Node):
+    __slots__ = ('left', 'op', 'right')
     def __init__(self, left, op, right):
         super().__init__()
         self.left = left
         self.op = op
         self.right = right
 
+class BinaryChain(Node):
+    """a + b + c + ... folded left to right with a single operator"""
+    __slots__ = ('op', 'operands')
+    def __init__(self, op, operands):
+        super().__init__()
+        self.op = op
+        self.operands = operands  # list of 3 or more expressions
+
 class UnaryOp(Node):
+    __slots__ = ('op', 'expr')
     def __init__(self, op, expr):
         super().__init__()
         self.op = op
@@ -177,6 +209,7 @@ class UnaryOp(Node):
 
 class TernaryOp(Node):
     """condition ? true_val : false_val"""
+    __slots__ = ('condition', 'true_val', 'false_val')
     def __init__(self, condition, true_val, false_val):
         super().__init__()
         self.condition = condition
@@ -186,6 +219,7 @@ class TernaryOp(Node):
 # ===== Control Flow =====
 
 class IfStatement(Node):
+    __slots__ = ('condition', 'then_body', 'else_body')
     def __init__(self, condition, then_body, else_body=None):
         super().__init__()
         self.condition = condition
@@ -193,12 +227,14 @@ class IfStatement(Node):
         self.else_body = else_body
 
 class WhileLoop(Node):
+    __slots__ = ('condition', 'body')
     def __init__(self, condition, body):
         super().__init__()
         self.condition = condition
         self.body = body
 
 class ForLoop(Node):
+    __slots__ = ('init', 'condition', 'update', 'body')
     def __init__(self, init, condition, update, body):
         super().__init__()
         self.init = init
@@ -207,6 +243,7 @@ class ForLoop(Node):
         self.body = body
 
 class ForInLoop(Node):
+    __slots__ = ('var_name', 'iterable', 'body')
     def __init__(self, var_name, iterable, body):
         super().__init__()
         self.var_name = var_name
@@ -214,6 +251,7 @@ class ForInLoop(Node):
         self.body = body
 
 class SwitchStatement(Node):
+    __slots__ = ('expr', 'cases', 'default')
     def __init__(self, expr, cases, default=None):
         super().__init__()
         self.expr = expr
@@ -222,20 +260,23 @@ class SwitchStatement(Node):
 
 class MatchStatement(Node):
     """Pattern matching: match expr { pattern => body, ... }"""
+    __slots__ = ('expr', 'arms')
     def __init__(self, expr, arms):
         super().__init__()
         self.expr = expr
         self.arms = arms  # list of (pattern, guard, body)
 
 class BreakStatement(Node):
+    __slots__ = ('value',)
     def __init__(self, value=None):
         super().__init__()
         self.value = value  # break can return a value
 
 class ContinueStatement(Node):
-    pass
+    __slots__ = ()
 
 class ReturnStatement(Node):
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
@@ -243,6 +284,7 @@ class ReturnStatement(Node):
 # ===== Functions =====
 
 class FunctionDef(Node):
+    __slots__ = ('name', 'params', 'body', 'return_type', 'is_async')
     def __init__(self, name, params, body, return_type=None, is_async=False):
         super().__init__()
         self.name = name
@@ -252,6 +294,7 @@ class FunctionDef(Node):
         self.is_async = is_async
 
 class FunctionCall(Node):
+    __slots__ = ('name', 'args', 'kwargs')
     def __init__(self, name, args, kwargs=None):
         super().__init__()
         self.name = name
@@ -260,6 +303,7 @@ class FunctionCall(Node):
 
 class LambdaExpr(Node):
     """Lambda/anonymous functions: |x, y| x + y"""
+    __slots__ = ('params', 'body')
     def __init__(self, params, body):
         super().__init__()
         self.params = params
@@ -267,12 +311,14 @@ class LambdaExpr(Node):
 
 class YieldStatement(Node):
     """Generator yield"""
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
 
 class AwaitExpr(Node):
     """Async/await"""
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
@@ -280,11 +326,13 @@ class AwaitExpr(Node):
 # ===== I/O =====
 
 class PrintStatement(Node):
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
 
 class PrintfStatement(Node):
+    __slots__ = ('format_expr', 'args')
     def __init__(self, format_expr, args):
         super().__init__()
         self.format_expr = format_expr
@@ -293,6 +341,7 @@ class PrintfStatement(Node):
 # ===== Error Handling =====
 
 class TryCatchStatement(Node):
+    __slots__ = ('try_block', 'catch_clauses', 'finally_block')
     def __init__(self, try_block, catch_clauses, finally_block=None):
         super().__init__()
         self.try_block = try_block
@@ -300,6 +349,7 @@ class TryCatchStatement(Node):
         self.finally_block = finally_block
 
 class ThrowStatement(Node):
+    __slots__ = ('expr',)
     def __init__(self, expr):
         super().__init__()
         self.expr = expr
@@ -308,6 +358,7 @@ class ThrowStatement(Node):
 
 class StructDef(Node):
     """struct Person { name: String, age: int32 }"""
+    __slots__ = ('name', 'fields')
     def __init__(self, name, fields):
         super().__init__()
         self.name = name
@@ -315,6 +366,7 @@ class StructDef(Node):
 
 class TypedefStruct(Node):
     """typedef struct Point { x: int32, y: int32 }"""
+    __slots__ = ('name', 'fields')
     def __init__(self, name, fields):
         super().__init__()
         self.name = name
@@ -322,6 +374,7 @@ class TypedefStruct(Node):
 
 class EnumDef(Node):
     """enum Color { Red, Green, Blue }"""
+    __slots__ = ('name', 'variants')
     def __init__(self, name, variants):
         super().__init__()
         self.name = name
@@ -329,6 +382,7 @@ class EnumDef(Node):
 
 class TraitDef(Node):
     """trait Drawable { fnc draw(); }"""
+    __slots__ = ('name', 'methods')
     def __init__(self, name, methods):
         super().__init__()
         self.name = name
@@ -336,6 +390,7 @@ class TraitDef(Node):
 
 class ImplBlock(Node):
     """impl Drawable for Circle { ... }"""
+    __slots__ = ('trait_name', 'type_name', 'methods')
     def __init__(self, trait_name, type_name, methods):
         super().__init__()
         self.trait_name = trait_name
@@ -344,6 +399,7 @@ class ImplBlock(Node):
 
 class StructLiteral(Node):
     """Person { name: "Alice", age: 30 }"""
+    __slots__ = ('struct_name', 'fields')
     def __init__(self, struct_name, fields):
         super().__init__()
         self.struct_name = struct_name
@@ -352,6 +408,7 @@ class StructLiteral(Node):
 # ===== Member Access =====
 
 class IndexAccess(Node):
+    __slots__ = ('collection', 'index')
     def __init__(self, collection, index):
         super().__init__()
         self.collection = collection
@@ -359,6 +416,7 @@ class IndexAccess(Node):
 
 class MemberAccess(Node):
     """obj.field or obj.method()"""
+    __slots__ = ('obj', 'member')
     def __init__(self, obj, member):
         super().__init__()
         self.obj = obj
@@ -366,6 +424,7 @@ class MemberAccess(Node):
 
 class SliceAccess(Node):
     """array[start:end:step]"""
+    __slots__ = ('collection', 'start', 'end', 'step')
     def __init__(self, collection, start, end, step=None):
         super().__init__()
         self.collection = collection
@@ -377,6 +436,7 @@ class SliceAccess(Node):
 
 class ImportStatement(Node):
     """import module or from module import name"""
+    __slots__ = ('module', 'names', 'alias')
     def __init__(self, module, names=None, alias=None):
         super().__init__()
         self.module = module
@@ -385,6 +445,7 @@ class ImportStatement(Node):
 
 class ExportStatement(Node):
     """export fnc or export const"""
+    __slots__ = ('declaration',)
     def __init__(self, declaration):
         super().__init__()
         self.declaration = declaration
@@ -393,6 +454,7 @@ class ExportStatement(Node):
 
 class TypeAlias(Node):
     """type UserId = uint64"""
+    __slots__ = ('name', 'type_expr')
     def __init__(self, name, type_expr):
         super().__init__()
         self.name = name
@@ -402,6 +464,7 @@ class TypeAlias(Node):
 
 class Decorator(Node):
     """@decorator or @decorator(args)"""
+    __slots__ = ('name', 'args')
     def __init__(self, name, args=None):
         super().__init__()
         self.name = name
@@ -411,12 +474,14 @@ class Decorator(Node):
 
 class NativeFunction(Node):
     """Wrapper for built-in functions"""
+    __slots__ = ('func',)
     def __init__(self, func):
         super().__init__()
         self.func = func
 
 class MacroDef(Node):
     """macro name(args) { body }"""
+    __slots__ = ('name', 'params', 'body')
     def __init__(self, name, params, body):
         super().__init__()
         self.name = name
@@ -425,6 +490,7 @@ class MacroDef(Node):
 
 class CompilerDirective(Node):
     """#[inline], #[no_mangle], etc."""
+    __slots__ = ('directive', 'args')
     def __init__(self, directive, args=None):
         super().__init__()
         self.directive = directive
@@ -432,6 +498,7 @@ class CompilerDirective(Node):
 
 class UnionDef(Node):
     """union Color { r: uint8, g: uint8, b: uint8 }"""
+    __slots__ = ('name', 'fields')
     def __init__(self, name, fields):
         super().__init__()
         self.name = name
@@ -439,6 +506,7 @@ class UnionDef(Node):
 
 class TypedefUnion(Node):
     """typedef union Color { r: uint8, g: uint8, b: uint8 }"""
+    __slots__ = ('name', 'fields')
     def __init__(self, name, fields):
         super().__init__()
         self.name = name
@@ -446,12 +514,14 @@ class TypedefUnion(Node):
 
 class AnonymousUnion(Node):
     """Anonymous union inside a struct"""
+    __slots__ = ('fields',)
     def __init__(self, fields):
         super().__init__()
         self.fields = fields  # list of (field_name, type)
 
 class UnionLiteral(Node):
     """Color { r: 255 } - initializing a union (only one field at a time)"""
+    __slots__ = ('union_name', 'field_name', 'value')
     def __init__(self, union_name, field_name, value):
         super().__init__()
         self.union_name = union_name
@@ -3,6 +3,63 @@ from decimal import Decimal
 import operator
 import os
 
+# Binary operator -> implementation, so applying an operator is one dict
+# lookup however far down the list it is (set operands are special-cased
+# in Interpreter.apply_binary_op first)
+BINARY_OPS = {
+    # Arithmetic
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+    "**": operator.pow,
+    # Comparison
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "===": operator.is_,
+    "!==": operator.is_not,
+    "<=>": lambda left, right: -1 if left < right else (0 if left == right else 1),
+    "in": lambda left, right: left in right,
+    # Logical
+    "and": lambda left, right: left and right,
+    "&&": lambda left, right: left and right,
+    "or": lambda left, right: left or right,
+    "||": lambda left, right: left or right,
+    "xor": lambda left, right: bool(left) ^ bool(right),
+    "then": lambda left, right: (not left) or right,
+    "nand": lambda left, right: not (left and right),
+    # Bitwise
+    "&": lambda left, right: int(left) & int(right),
+    "|": lambda left, right: int(left) | int(right),
+    "^": lambda left, right: int(left) ^ int(right),
+    "<<": lambda left, right: int(left) << int(right),
+    ">>": lambda left, right: int(left) >> int(right),
+}
+
+# Built once at import rather than on every augmented assignment / char
+# literal evaluation
+AUGMENTED_OPS = {
+    "+=": operator.add,
+    "-=": operator.sub,
+    "*=": operator.mul,
+    "/=": operator.truediv,
+    "//=": operator.floordiv,
+    "%=": operator.mod,
+    "**=": operator.pow,
+    "&=": operator.and_,
+    "|=": operator.or_,
+    "^=": operator.xor,
+    "<<=": operator.lshift,
+    ">>=": operator.rshift,
+}
+CHAR_ESCAPES = {"\\n": "\n", "\\t": "\t", "\\'": "'", "\\\\": "\\", "\\r": "\r", "\\0": "\0"}
+
 # ===== Runtime Exceptions =====
 
 class RuntimeError(Exception):
@@ -30,13 +87,20 @@ class ContinueException(Exception):
 
 class Function:
     """User-defined function"""
-    def __init__(self, def_node, env):
+    __slots__ = ('def_node', 'env', 'body', 'is_async', 'required_params')
+
+    def __init__(self, def_node, env, body):
         self.def_node = def_node
         self.env = env  # Closure environment
-        self.is_async = def_node.is_async if hasattr(def_node, 'is_async') else False
+        self.body = body  # (handler, stmt) pairs from Interpreter.bind_body
+        self.is_async = def_node.is_async
+        # Parameters without a default; fixed for the life of the function
+        self.required_params = sum(1 for _, _, default in def_node.params if default is None)
 
 class Lambda:
     """Lambda/anonymous function"""
+    __slots__ = ('params', 'body', 'env')
+
     def __init__(self, params, body, env):
         self.params = params
         self.body = body
@@ -44,6 +108,8 @@ class Lambda:
 
 class Struct:
     """Runtime struct instance"""
+    __slots__ = ('struct_name', 'fields')
+
     def __init__(self, struct_name, fields):
         self.struct_name = struct_name
         self.fields = fields  # dict of field_name -> value
@@ -53,6 +119,8 @@ class Struct:
     
 class Union:
     """Runtime union instance - only one field is active at a time"""
+    __slots__ = ('union_name', 'active_field', 'value')
+
     def __init__(self, union_name, active_field, value):
         self.union_name = union_name
         self.active_field = active_field  # which field is currently set
@@ -63,6 +131,8 @@ class Union:
 
 class Enum:
     """Runtime enum variant"""
+    __slots__ = ('enum_name', 'variant_name', 'data')
+
     def __init__(self, enum_name, variant_name, data=None):
         self.enum_name = enum_name
         self.variant_name = variant_name
@@ -75,6 +145,8 @@ class Enum:
 
 class Range:
     """Range object for iteration"""
+    __slots__ = ('start', 'end', 'inclusive')
+
     def __init__(self, start, end, inclusive=False):
         self.start = start
         self.end = end
@@ -87,6 +159,8 @@ class Range:
 
 class Module:
     """Represents an imported module"""
+    __slots__ = ('name', 'env')
+
     def __init__(self, name, env):
         self.name = name
         self.env = env  # The module's environment
@@ -94,10 +168,59 @@ class Module:
     def __repr__(self):
         return f"Module({self.name})"
 
+# Parsed module files shared by every Interpreter: real path ->
+# ((mtime_ns, size), Program). Kept in least-recently-used order and
+# capped at MODULE_AST_CACHE_SIZE entries so a long session doesn't keep
+# every tree it ever imported.
+MODULE_AST_CACHE_SIZE = 32
+_MODULE_ASTS = {}
+
+def parse_module_file(filepath):
+    """Read and parse a module file, reusing the AST of an earlier import
+    
+    The tree is kept while the file's mtime and size are unchanged, so a
+    module imported from several places (or again after a REPL reset) is
+    only parsed once.
+    """
+    from lexer import iter_tokens
+    from parser_enhanced import Parser
+    
+    realpath = os.path.realpath(filepath)
+    try:
+        st = os.stat(realpath)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _MODULE_ASTS.pop(realpath, None)
+        if cached is not None and cached[0] == stamp:
+            _MODULE_ASTS[realpath] = cached  # Move to the newest end
+            return cached[1]
+        with open(realpath, 'r') as f:
+            code = f.read()
+    except Exception as e:
+        raise RuntimeError(f"Error reading module {filepath}: {e}")
+    
+    try:
+        ast = Parser(iter_tokens(code)).parse()
+    except Exception as e:
+        raise RuntimeError(f"Error parsing module {filepath}: {e}")
+    
+    _MODULE_ASTS[realpath] = (stamp, ast)
+    if len(_MODULE_ASTS) > MODULE_AST_CACHE_SIZE:
+        del _MODULE_ASTS[next(iter(_MODULE_ASTS))]
+    return ast
+
 # ===== Environment =====
 
+# Wrapping integer types: masks for the unsigned ones, bit widths for the
+# signed ones
+UNSIGNED_MASKS = {f"uint{bits}": (1 << bits) - 1
+                  for bits in (8, 16, 32, 64, 128, 256)}
+SIGNED_WIDTHS = {f"int{bits}": bits for bits in (8, 16, 32, 64, 128, 256)}
+SIGNED_WIDTHS["isize"] = SIGNED_WIDTHS["ptrdiff"] = 64
+
 class Environment:
     """Enhanced environment with type tracking and scoping"""
+    __slots__ = ('vars', 'parent', 'structs', 'unions', 'enums', 'types')
+
     def __init__(self, parent=None):
         self.vars = {}  # name -> (value, type, is_const, is_mut)
         self.parent = parent
@@ -163,15 +286,12 @@ class Environment:
 
     def wrap_type(self, value, var_type):
         """Apply type constraints (wrapping for integer types)"""
-        if var_type in ("uint8", "uint16", "uint32", "uint64", "uint128", "uint256"):
-            bit_size = int(var_type[4:])
-            mask = (1 << bit_size) - 1
+        mask = UNSIGNED_MASKS.get(var_type)
+        if mask is not None:
             return value & mask
-        elif var_type in ("int8", "int16", "int32", "int64", "int128", "int256"):
-            bit_size = int(var_type[3:])
+        bit_size = SIGNED_WIDTHS.get(var_type)
+        if bit_size is not None:
             return self.signed_wrap(value, bit_size)
-        elif var_type in ("isize", "ptrdiff"):
-            return self.signed_wrap(value, 64)
         elif var_type == "usize":
             return value % (1 << 64)
         return value
@@ -184,12 +304,14 @@ class Environment:
 
 class Interpreter:
     """Enhanced interpreter with import support"""
+    __slots__ = ('global_env', 'env', 'modules', 'current_file_dir')
+
     def __init__(self):
         self.global_env = Environment()
         self.env = self.global_env
-        self.setup_builtins()
         self.modules = {}  # Cache for loaded modules: filepath -> Module
         self.current_file_dir = os.getcwd()  # Track current file directory for relative imports
+        self.setup_builtins()
 
     def setup_builtins(self):
         """Setup built-in functions and constants"""
@@ -249,23 +371,8 @@ class Interpreter:
         if not os.path.exists(final_filepath):
             raise RuntimeError(f"Module file not found: {final_filepath}")
         
-        # Read file
-        try:
-            with open(final_filepath, 'r') as f:
-                code = f.read()
-        except Exception as e:
-            raise RuntimeError(f"Error reading module {final_filepath}: {e}")
-        
-        # Parse and execute in new environment
-        from lexer import tokenize
-        from parser_enhanced import Parser
-        
-        try:
-            tokens = tokenize(code)
-            parser = Parser(tokens)
-            ast = parser.parse()
-        except Exception as e:
-            raise RuntimeError(f"Error parsing module {final_filepath}: {e}")
+        # Read and parse (shared with earlier imports of the same file)
+        ast = parse_module_file(final_filepath)
         
         # Create new environment for module
         module_env = Environment(parent=self.global_env)
@@ -294,8 +401,11 @@ class Interpreter:
 
     def eval(self, node):
         """Evaluate an AST node"""
+        handler = self._handlers.get(type(node))
+        if handler is None:
+            raise RuntimeError(f"Unknown node type: {type(node).__name__}")
         try:
-            return self._eval_node(node)
+            return handler(self, node)
         except (ReturnException, BreakException, ContinueException):
             # Re-raise control flow exceptions
             raise
@@ -304,415 +414,427 @@ class Interpreter:
         except Exception as e:
             raise RuntimeError(f"Runtime error: {e}", node)
 
-    def _eval_node(self, node):
-        """Internal evaluation dispatch"""
-        
-        # ===== Program =====
-        if isinstance(node, Program):
-            result = None
-            for stmt in node.statements:
-                result = self.eval(stmt)
-            return result
+    # ===== Program =====
 
-        # ===== Variables =====
-        elif isinstance(node, VarDecl):
-            value = self.eval(node.value)
-            self.env.define(node.name, value, node.var_type, node.is_const, node.is_mut)
-            return value
-
-        elif isinstance(node, Assignment):
-            value = self.eval(node.value)
-            if isinstance(node.name, MemberAccess):
-                # obj.field = value
-                obj = self.eval(node.name.obj)
-                if isinstance(obj, Struct):
-                    obj.fields[node.name.member] = value
-                elif isinstance(obj, dict):
-                    obj[node.name.member] = value
-                else:
-                    raise RuntimeError(f"Cannot assign to member of {type(obj).__name__}")
+    def eval_program(self, node):
+        result = None
+        for stmt in node.statements:
+            result = self.eval(stmt)
+        return result
+
+    # ===== Variables =====
+
+    def eval_var_decl(self, node):
+        value = self.eval(node.value)
+        self.env.define(node.name, value, node.var_type, node.is_const, node.is_mut)
+        return value
+
+    def eval_assignment(self, node):
+        value = self.eval(node.value)
+        if isinstance(node.name, MemberAccess):
+            # obj.field = value
+            obj = self.eval(node.name.obj)
+            if isinstance(obj, Struct):
+                obj.fields[node.name.member] = value
+            elif isinstance(obj, dict):
+                obj[node.name.member] = value
             else:
-                self.env.set(node.name, value)
-            return value
+                raise RuntimeError(f"Cannot assign to member of {type(obj).__name__}")
+        else:
+            self.env.set(node.name, value)
+        return value
 
-        elif isinstance(node, AugmentedAssignment):
-            current = self.env.get(node.name)
-            new_val = self.apply_augmented_op(current, node.operator, self.eval(node.value))
-            self.env.set(node.name, new_val)
-            return new_val
+    def eval_augmented_assignment(self, node):
+        current = self.env.get(node.name)
+        new_val = self.apply_augmented_op(current, node.operator, self.eval(node.value))
+        self.env.set(node.name, new_val)
+        return new_val
 
-        elif isinstance(node, Identifier):
-            return self.env.get(node.name)
+    def eval_identifier(self, node):
+        return self.env.get(node.name)
 
-        # ===== Literals =====
-        elif isinstance(node, Literal):
-            return node.value
-        
-        elif isinstance(node, ArrayLiteral):
-            return [self.eval(elem) for elem in node.elements]
-        
-        elif isinstance(node, NullLiteral):
-            return None
-        
-        elif isinstance(node, DictLiteral):
-            return {self.eval(k): self.eval(v) for k, v in node.pairs}
-        
-        elif isinstance(node, TupleLiteral):
-            return tuple(self.eval(e) for e in node.elements)
-        
-        elif isinstance(node, SetLiteral):
-            return set(self.eval(e) for e in node.elements)
-        
-        elif isinstance(node, CharLiteral):
-            val = node.value
-            if val.startswith("\\"):
-                escapes = {"\\n": "\n", "\\t": "\t", "\\'": "'", "\\\\": "\\", "\\r": "\r", "\\0": "\0"}
-                return escapes.get(val, val[1:])
-            return val
-        
-        elif isinstance(node, BigIntLiteral):
-            return node.value
-        
-        elif isinstance(node, DecimalLiteral):
-            return node.value
-        
-        elif isinstance(node, RangeLiteral):
-            start = self.eval(node.start)
-            end = self.eval(node.end)
-            return Range(start, end, node.inclusive)
-        
-        elif isinstance(node, StringInterpolation):
-            # Simplified - just return the parts concatenated
-            return ''.join(str(self.eval(part)) for part in node.parts)
-
-        # ===== Integer Types =====
-        elif isinstance(node, UIntLiteral):
-            val = self.eval(node.value)
-            mask = (1 << node.bit_size) - 1
-            return val & mask
+    # ===== Literals =====
+
+    def eval_literal(self, node):
+        return node.value
+
+    def eval_array_literal(self, node):
+        return [self.eval(elem) for elem in node.elements]
+
+    def eval_null_literal(self, node):
+        return None
+
+    def eval_dict_literal(self, node):
+        return {self.eval(k): self.eval(v) for k, v in node.pairs}
+
+    def eval_tuple_literal(self, node):
+        return tuple(self.eval(e) for e in node.elements)
+
+    def eval_set_literal(self, node):
+        return set(self.eval(e) for e in node.elements)
+
+    def eval_char_literal(self, node):
+        val = node.value
+        if val.startswith("\\"):
+            return CHAR_ESCAPES.get(val, val[1:])
+        return val
+
+    def eval_range_literal(self, node):
+        start = self.eval(node.start)
+        end = self.eval(node.end)
+        return Range(start, end, node.inclusive)
+
+    def eval_string_interpolation(self, node):
+        # Simplified - just return the parts concatenated
+        return ''.join(str(self.eval(part)) for part in node.parts)
+
+    # ===== Integer Types =====
+
+    def eval_uint_literal(self, node):
+        val = self.eval(node.value)
+        mask = (1 << node.bit_size) - 1
+        return val & mask
+
+    def eval_int_literal(self, node):
+        val = node.value
+        if isinstance(val, Node):
+            val = self.eval(val)
+        return self.env.signed_wrap(val, node.bits)
+
+    def eval_size_int_literal(self, node):
+        val = self.eval(node.expr)
+        if node.signed:
+            return self.env.signed_wrap(val, 64)
+        else:
+            return val % (1 << 64)
+
+    def eval_ptr_diff_literal(self, node):
+        val = self.eval(node.expr)
+        return self.env.signed_wrap(val, 64)
+
+    # ===== Operators =====
+
+    def eval_ternary_op(self, node):
+        condition = self.eval(node.condition)
+        if condition:
+            return self.eval(node.true_val)
+        else:
+            return self.eval(node.false_val)
+
+    # ===== Control Flow =====
+
+    def eval_if_statement(self, node):
+        if self.eval(node.condition):
+            for stmt in node.then_body:
+                self.eval(stmt)
+        elif node.else_body:
+            for stmt in node.else_body:
+                self.eval(stmt)
+
+    def eval_while_loop(self, node):
+        condition = node.condition
+        body = self.bind_body(node.body)
+        try:
+            while self.eval(condition):
+                try:
+                    for handler, stmt in body:
+                        handler(self, stmt)
+                except ContinueException:
+                    continue
+                except (ReturnException, BreakException, RuntimeError):
+                    raise
+                except Exception as e:
+                    # Attribute the error to the statement that failed,
+                    # as eval() would have
+                    raise RuntimeError(f"Runtime error: {e}", stmt)
+        except BreakException as e:
+            pass
+
+    def eval_for_loop(self, node):
+        self.eval(node.init)
+        condition = node.condition
+        update = node.update
+        body = self.bind_body(node.body)
+        try:
+            while self.eval(condition):
+                try:
+                    for handler, stmt in body:
+                        handler(self, stmt)
+                except ContinueException:
+                    pass
+                except (ReturnException, BreakException, RuntimeError):
+                    raise
+                except Exception as e:
+                    # Attribute the error to the statement that failed,
+                    # as eval() would have
+                    raise RuntimeError(f"Runtime error: {e}", stmt)
+                self.eval(update)
+        except BreakException:
+            pass
+
+    def eval_for_in_loop(self, node):
+        iterable = self.eval(node.iterable)
         
-        elif isinstance(node, IntLiteral):
-            val = node.value
-            if isinstance(val, Node):
-                val = self.eval(val)
-            return self.env.signed_wrap(val, node.bits)
+        # Handle Range objects
+        if isinstance(iterable, Range):
+            iterable = list(iterable)
         
-        elif isinstance(node, SizeIntLiteral):
-            val = self.eval(node.expr)
-            if node.signed:
-                return self.env.signed_wrap(val, 64)
-            else:
-                return val % (1 << 64)
+        if not hasattr(iterable, "__iter__"):
+            raise RuntimeError("Value in 'for ... in' is not iterable")
         
-        elif isinstance(node, PtrDiffLiteral):
-            val = self.eval(node.expr)
-            return self.env.signed_wrap(val, 64)
+        var_name = node.var_name
+        body = self.bind_body(node.body)
+        try:
+            for val in iterable:
+                self.env.define(var_name, val)
+                try:
+                    for handler, stmt in body:
+                        handler(self, stmt)
+                except ContinueException:
+                    continue
+                except (ReturnException, BreakException, RuntimeError):
+                    raise
+                except Exception as e:
+                    # Attribute the error to the statement that failed,
+                    # as eval() would have
+                    raise RuntimeError(f"Runtime error: {e}", stmt)
+        except BreakException:
+            pass
 
-        # ===== Operators =====
-        elif isinstance(node, BinaryOp):
-            return self.eval_binary_op(node)
-        
-        elif isinstance(node, UnaryOp):
-            return self.eval_unary_op(node)
+    def bind_body(self, stmts):
+        """Resolve the handler of each statement in a loop or function body
         
-        elif isinstance(node, TernaryOp):
-            condition = self.eval(node.condition)
-            if condition:
-                return self.eval(node.true_val)
-            else:
-                return self.eval(node.false_val)
+        The body runs many times with the same nodes, so the handler lookup
+        is hoisted out of the iterations. The handlers are called directly,
+        so the code running the body wraps errors with the failing
+        statement itself, the way eval() does.
+        """
+        handlers = self._handlers
+        return [(handlers.get(type(stmt), Interpreter.eval), stmt) for stmt in stmts]
 
-        # ===== Control Flow =====
-        elif isinstance(node, IfStatement):
-            if self.eval(node.condition):
-                for stmt in node.then_body:
-                    self.eval(stmt)
-            elif node.else_body:
-                for stmt in node.else_body:
-                    self.eval(stmt)
+    def eval_switch_statement(self, node):
+        switch_val = self.eval(node.expr)
+        executed = False
+        for case_val, stmts in node.cases:
+            if switch_val == self.eval(case_val):
+                try:
+                    for stmt in stmts:
+                        if isinstance(stmt, BreakStatement):
+                            executed = True
+                            break
+                        if isinstance(stmt, ContinueStatement):
+                            continue
+                        self.eval(stmt)
+                except BreakException:
+                    pass
+                executed = True
+                break
+        if not executed and node.default:
+            for stmt in node.default:
+                self.eval(stmt)
 
-        elif isinstance(node, WhileLoop):
-            try:
-                while self.eval(node.condition):
-                    try:
-                        for stmt in node.body:
-                            self.eval(stmt)
-                    except ContinueException:
-                        continue
-            except BreakException as e:
-                pass
-
-        elif isinstance(node, ForLoop):
-            self.eval(node.init)
-            try:
-                while self.eval(node.condition):
-                    try:
-                        for stmt in node.body:
-                            self.eval(stmt)
-                    except ContinueException:
-                        pass
-                    self.eval(node.update)
-            except BreakException:
-                pass
-
-        elif isinstance(node, ForInLoop):
-            iterable = self.eval(node.iterable)
-            
-            # Handle Range objects
-            if isinstance(iterable, Range):
-                iterable = list(iterable)
-            
-            if not hasattr(iterable, "__iter__"):
-                raise RuntimeError("Value in 'for ... in' is not iterable")
-            
-            try:
-                for val in iterable:
-                    self.env.define(node.var_name, val)
-                    try:
-                        for stmt in node.body:
-                            self.eval(stmt)
-                    except ContinueException:
-                        continue
-            except BreakException:
-                pass
-
-        elif isinstance(node, SwitchStatement):
-            switch_val = self.eval(node.expr)
-            executed = False
-            for case_val, stmts in node.cases:
-                if switch_val == self.eval(case_val):
-                    try:
-                        for stmt in stmts:
-                            if isinstance(stmt, BreakStatement):
-                                executed = True
-                                break
-                            if isinstance(stmt, ContinueStatement):
-                                continue
-                            self.eval(stmt)
-                    except BreakException:
-                        pass
-                    executed = True
+    def eval_match_statement(self, node):
+        value = self.eval(node.expr)
+        for pattern, guard, body in node.arms:
+            if self.match_pattern(pattern, value):
+                if guard is None or self.eval(guard):
+                    for stmt in body:
+                        self.eval(stmt)
                     break
-            if not executed and node.default:
-                for stmt in node.default:
-                    self.eval(stmt)
 
-        elif isinstance(node, MatchStatement):
-            value = self.eval(node.expr)
-            for pattern, guard, body in node.arms:
-                if self.match_pattern(pattern, value):
-                    if guard is None or self.eval(guard):
-                        for stmt in body:
-                            self.eval(stmt)
-                        break
-
-        elif isinstance(node, BreakStatement):
-            value = self.eval(node.value) if node.value else None
-            raise BreakException(value)
-        
-        elif isinstance(node, ContinueStatement):
-            raise ContinueException()
-        
-        elif isinstance(node, ReturnStatement):
-            value = self.eval(node.expr) if node.expr else None
-            raise ReturnException(value)
-
-        # ===== Functions =====
-        elif isinstance(node, FunctionDef):
-            func = Function(node, self.env)
-            self.env.define(node.name, func, is_const=True)
-            return func
-
-        elif isinstance(node, FunctionCall):
-            return self.eval_function_call(node)
-
-        elif isinstance(node, LambdaExpr):
-            return Lambda(node.params, node.body, self.env)
-
-        elif isinstance(node, YieldStatement):
-            # Simplified generator support
-            value = self.eval(node.expr)
-            return value
-
-        elif isinstance(node, AwaitExpr):
-            # Simplified async support
-            return self.eval(node.expr)
-
-        # ===== I/O =====
-        elif isinstance(node, PrintStatement):
-            value = self.eval(node.expr)
-            # Handle escape sequences in strings
-            if isinstance(value, str):
-                value = value.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r').replace('\\\\', '\\')
-            print(value)
-
-        elif isinstance(node, PrintfStatement):
-            fmt = self.eval(node.format_expr)
-            values = [self.eval(arg) for arg in node.args]
-            # Handle escape sequences properly
-            fmt = fmt.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r').replace('\\\\', '\\')
-            print(fmt % tuple(values), end="")
-
-        # ===== Error Handling =====
-        elif isinstance(node, TryCatchStatement):
-            try:
-                for stmt in node.try_block:
-                    self.eval(stmt)
-            except Exception as e:
-                # Try each catch clause
-                caught = False
-                for exception_type, catch_var, catch_block in node.catch_clauses:
-                    # Simple exception matching (can be enhanced)
-                    if exception_type is None or exception_type in str(type(e).__name__):
-                        if catch_var:
-                            self.env.define(catch_var, str(e))
-                        for stmt in catch_block:
-                            self.eval(stmt)
-                        caught = True
-                        break
-                if not caught:
-                    raise
-            finally:
-                if node.finally_block:
-                    for stmt in node.finally_block:
+    def eval_break_statement(self, node):
+        value = self.eval(node.value) if node.value else None
+        raise BreakException(value)
+
+    def eval_continue_statement(self, node):
+        raise ContinueException()
+
+    def eval_return_statement(self, node):
+        value = self.eval(node.expr) if node.expr else None
+        raise ReturnException(value)
+
+    # ===== Functions =====
+
+    def eval_function_def(self, node):
+        func = Function(node, self.env, self.bind_body(node.body))
+        self.env.define(node.name, func, is_const=True)
+        return func
+
+    def eval_lambda_expr(self, node):
+        return Lambda(node.params, node.body, self.env)
+
+    def eval_yield_statement(self, node):
+        # Simplified generator support
+        value = self.eval(node.expr)
+        return value
+
+    def eval_await_expr(self, node):
+        # Simplified async support
+        return self.eval(node.expr)
+
+    # ===== I/O =====
+
+    def eval_print_statement(self, node):
+        value = self.eval(node.expr)
+        # Handle escape sequences in strings
+        if isinstance(value, str):
+            value = value.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r').replace('\\\\', '\\')
+        print(value)
+
+    def eval_printf_statement(self, node):
+        fmt = self.eval(node.format_expr)
+        values = [self.eval(arg) for arg in node.args]
+        # Handle escape sequences properly
+        fmt = fmt.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r').replace('\\\\', '\\')
+        print(fmt % tuple(values), end="")
+
+    # ===== Error Handling =====
+
+    def eval_try_catch_statement(self, node):
+        try:
+            for stmt in node.try_block:
+                self.eval(stmt)
+        except Exception as e:
+            # Try each catch clause
+            caught = False
+            for exception_type, catch_var, catch_block in node.catch_clauses:
+                # Simple exception matching (can be enhanced)
+                if exception_type is None or exception_type in str(type(e).__name__):
+                    if catch_var:
+                        self.env.define(catch_var, str(e))
+                    for stmt in catch_block:
                         self.eval(stmt)
+                    caught = True
+                    break
+            if not caught:
+                raise
+        finally:
+            if node.finally_block:
+                for stmt in node.finally_block:
+                    self.eval(stmt)
 
-        elif isinstance(node, ThrowStatement):
-            value = self.eval(node.expr)
-            raise Exception(str(value))
+    def eval_throw_statement(self, node):
+        value = self.eval(node.expr)
+        raise Exception(str(value))
 
-        # ===== Data Structures =====
-        elif isinstance(node, StructDef):
-            self.env.structs[node.name] = node
-            return None
-        
-        elif isinstance(node, TypedefStruct):
-            self.env.structs[node.name] = node
-            return None
-        
-        elif isinstance(node, UnionDef):
-            # Store union definition
-            self.env.unions[node.name] = node
-            return None
+    # ===== Data Structures =====
+
+    def eval_struct_def(self, node):
+        self.env.structs[node.name] = node
+        return None
+
+    def eval_union_def(self, node):
+        # Store union (or typedef union) definition
+        self.env.unions[node.name] = node
+        return None
+
+    def eval_struct_literal(self, node):
+        # FIRST check if it's a union before checking struct
+        current_env = self.env
+        while current_env:
+            if node.struct_name in current_env.unions:
+                # It's a union! Create Union object
+                union_def = current_env.unions[node.struct_name]
+                # Union can only have one field set
+                if isinstance(node.fields, dict) and len(node.fields) == 1:
+                    field_name, value_expr = list(node.fields.items())[0]
+                    return Union(node.struct_name, field_name, self.eval(value_expr))
+                else:
+                    raise RuntimeError(f"Union '{node.struct_name}' can only be initialized with one field")
+            current_env = current_env.parent
         
-        elif isinstance(node, TypedefUnion):
-            # Store typedef union definition
-            self.env.unions[node.name] = node
-            return None
+        # Not a union, check if it's a struct
+        current_env = self.env
+        struct_def = None
+        while current_env:
+            if node.struct_name in current_env.structs:
+                struct_def = current_env.structs[node.struct_name]
+                break
+            current_env = current_env.parent
         
-        elif isinstance(node, StructLiteral):
-            # FIRST check if it's a union before checking struct
-            current_env = self.env
-            while current_env:
-                if node.struct_name in current_env.unions:
-                    # It's a union! Create Union object
-                    union_def = current_env.unions[node.struct_name]
-                    # Union can only have one field set
-                    if isinstance(node.fields, dict) and len(node.fields) == 1:
-                        field_name, value_expr = list(node.fields.items())[0]
-                        return Union(node.struct_name, field_name, self.eval(value_expr))
-                    else:
-                        raise RuntimeError(f"Union '{node.struct_name}' can only be initialized with one field")
-                current_env = current_env.parent
+        if struct_def:
+            fields = {}
             
-            # Not a union, check if it's a struct
-            current_env = self.env
-            struct_def = None
-            while current_env:
-                if node.struct_name in current_env.structs:
-                    struct_def = current_env.structs[node.struct_name]
-                    break
-                current_env = current_env.parent
+            # First, apply all default values
+            for field_info in struct_def.fields:
+                if len(field_info) == 3:  # Regular field
+                    field_name, field_type, default_value = field_info
+                    if default_value is not None:
+                        fields[field_name] = self.eval(default_value)
+                elif len(field_info) == 2 and field_info[0] == "__union__":
+                    # Anonymous union - don't set defaults
+                    pass
             
-            if struct_def:
-                fields = {}
-                
-                # First, apply all default values
-                for field_info in struct_def.fields:
-                    if len(field_info) == 3:  # Regular field
-                        field_name, field_type, default_value = field_info
-                        if default_value is not None:
-                            fields[field_name] = self.eval(default_value)
-                    elif len(field_info) == 2 and field_info[0] == "__union__":
-                        # Anonymous union - don't set defaults
-                        pass
-                
-                # Then, override with provided values
-                if isinstance(node.fields, dict):
-                    for name, value_expr in node.fields.items():
-                        fields[name] = self.eval(value_expr)
-                else:
-                    # Positional initialization
-                    for i, value_expr in enumerate(node.fields):
-                        field_name = struct_def.fields[i][0]
-                        fields[field_name] = self.eval(value_expr)
-                
-                return Struct(node.struct_name, fields)
+            # Then, override with provided values
+            if isinstance(node.fields, dict):
+                for name, value_expr in node.fields.items():
+                    fields[name] = self.eval(value_expr)
             else:
-                raise RuntimeError(f"Undefined struct or union: {node.struct_name}")
-                    
-        elif isinstance(node, EnumDef):
-            self.env.enums[node.name] = node
-            # Create constructor functions for each variant
-            for variant_name, _ in node.variants:
-                def make_variant(enum_name, var_name):
-                    def constructor(*args):
-                        return Enum(enum_name, var_name, args if args else None)
-                    return constructor
-                self.env.define(f"{node.name}_{variant_name}", 
-                                make_variant(node.name, variant_name), 
-                                is_const=True)
-            return None
-        
-        elif isinstance(node, TypeAlias):
-            self.env.types[node.name] = node.type_expr
-            return None
-        
-        # ===== Member Access =====
-        elif isinstance(node, IndexAccess):
-            collection = self.eval(node.collection)
-            index = self.eval(node.index)
-            try:
-                return collection[index]
-            except (KeyError, IndexError, TypeError) as e:
-                raise RuntimeError(f"Cannot index {type(collection).__name__} with {index}: {e}")
+                # Positional initialization
+                for i, value_expr in enumerate(node.fields):
+                    field_name = struct_def.fields[i][0]
+                    fields[field_name] = self.eval(value_expr)
+            
+            return Struct(node.struct_name, fields)
+        else:
+            raise RuntimeError(f"Undefined struct or union: {node.struct_name}")
 
-        elif isinstance(node, MemberAccess):
-            obj = self.eval(node.obj)
-            if isinstance(obj, Struct):
-                if node.member in obj.fields:
-                    return obj.fields[node.member]
-                raise RuntimeError(f"Struct {obj.struct_name} has no field '{node.member}'")
-            elif isinstance(obj, Union):
-                # For unions, you can only access the active field
-                if node.member == obj.active_field:
-                    return obj.value
-                else:
-                    raise RuntimeError(f"Union field '{node.member}' is not active (active field is '{obj.active_field}')")
-            elif isinstance(obj, Module):
-                # Access module members
-                try:
-                    return obj.env.get(node.member)
-                except RuntimeError:
-                    raise RuntimeError(f"Module '{obj.name}' has no member '{node.member}'")
-            elif isinstance(obj, dict):
-                return obj.get(node.member)
+    def eval_enum_def(self, node):
+        self.env.enums[node.name] = node
+        # Create constructor functions for each variant
+        for variant_name, _ in node.variants:
+            def make_variant(enum_name, var_name):
+                def constructor(*args):
+                    return Enum(enum_name, var_name, args if args else None)
+                return constructor
+            self.env.define(f"{node.name}_{variant_name}", 
+                            make_variant(node.name, variant_name), 
+                            is_const=True)
+        return None
+
+    def eval_type_alias(self, node):
+        self.env.types[node.name] = node.type_expr
+        return None
+
+    # ===== Member Access =====
+
+    def eval_index_access(self, node):
+        collection = self.eval(node.collection)
+        index = self.eval(node.index)
+        try:
+            return collection[index]
+        except (KeyError, IndexError, TypeError) as e:
+            raise RuntimeError(f"Cannot index {type(collection).__name__} with {index}: {e}")
+
+    def eval_member_access(self, node):
+        obj = self.eval(node.obj)
+        if isinstance(obj, Struct):
+            if node.member in obj.fields:
+                return obj.fields[node.member]
+            raise RuntimeError(f"Struct {obj.struct_name} has no field '{node.member}'")
+        elif isinstance(obj, Union):
+            # For unions, you can only access the active field
+            if node.member == obj.active_field:
+                return obj.value
             else:
-                raise RuntimeError(f"Cannot access member '{node.member}' of {type(obj).__name__}")
-        
-        elif isinstance(node, SliceAccess):
-            collection = self.eval(node.collection)
-            start = self.eval(node.start) if node.start else None
-            end = self.eval(node.end) if node.end else None
-            step = self.eval(node.step) if node.step else None
-            return collection[start:end:step]
-        
-        # ===== Imports =====
-        elif isinstance(node, ImportStatement):
-            return self.handle_import(node)
-        
+                raise RuntimeError(f"Union field '{node.member}' is not active (active field is '{obj.active_field}')")
+        elif isinstance(obj, Module):
+            # Access module members
+            try:
+                return obj.env.get(node.member)
+            except RuntimeError:
+                raise RuntimeError(f"Module '{obj.name}' has no member '{node.member}'")
+        elif isinstance(obj, dict):
+            return obj.get(node.member)
         else:
-            raise RuntimeError(f"Unknown node type: {type(node).__name__}")
+            raise RuntimeError(f"Cannot access member '{node.member}' of {type(obj).__name__}")
+
+    def eval_slice_access(self, node):
+        collection = self.eval(node.collection)
+        start = self.eval(node.start) if node.start else None
+        end = self.eval(node.end) if node.end else None
+        step = self.eval(node.step) if node.step else None
+        return collection[start:end:step]
     
     def handle_import(self, node):
         """Handle import statements"""
@@ -779,8 +901,21 @@ class Interpreter:
         """Evaluate binary operators"""
         left = self.eval(node.left)
         right = self.eval(node.right)
+        return self.apply_binary_op(node.op, left, right)
+
+    def eval_binary_chain(self, node):
+        """Evaluate a + b + c ... as ((a + b) + c) ..."""
+        operands = node.operands
         op = node.op
+        evaluate = self.eval
+        apply = self.apply_binary_op
+        result = evaluate(operands[0])
+        for i in range(1, len(operands)):
+            result = apply(op, result, evaluate(operands[i]))
+        return result
 
+    def apply_binary_op(self, op, left, right):
+        """Apply a binary operator to two evaluated operands"""
         # Set operations
         if isinstance(left, set) or isinstance(right, set):
             if op == '+':
@@ -792,70 +927,10 @@ class Interpreter:
             elif op == 'in':
                 return left in right
 
-        # Arithmetic
-        if op == "+":
-            return left + right
-        elif op == "-":
-            return left - right
-        elif op == "*":
-            return left * right
-        elif op == "/":
-            return left / right
-        elif op == "//":
-            return left // right
-        elif op == "%":
-            return left % right
-        elif op == "**":
-            return left ** right
-
-        # Comparison
-        elif op == "==":
-            return left == right
-        elif op == "!=":
-            return left != right
-        elif op == "<":
-            return left < right
-        elif op == ">":
-            return left > right
-        elif op == "<=":
-            return left <= right
-        elif op == ">=":
-            return left >= right
-        elif op == "===":
-            return left is right
-        elif op == "!==":
-            return left is not right
-        elif op == "<=>":
-            return -1 if left < right else (0 if left == right else 1)
-        elif op == "in":
-            return left in right
-
-        # Logical
-        elif op == "and" or op == "&&":
-            return left and right
-        elif op == "or" or op == "||":
-            return left or right
-        elif op == "xor":
-            return bool(left) ^ bool(right)
-        elif op == "then":
-            return (not left) or right
-        elif op == "nand":
-            return not (left and right)
-
-        # Bitwise
-        elif op == "&":
-            return int(left) & int(right)
-        elif op == "|":
-            return int(left) | int(right)
-        elif op == "^":
-            return int(left) ^ int(right)
-        elif op == "<<":
-            return int(left) << int(right)
-        elif op == ">>":
-            return int(left) >> int(right)
-
-        else:
+        func = BINARY_OPS.get(op)
+        if func is None:
             raise RuntimeError(f"Unknown binary operator: {op}")
+        return func(left, right)
 
     def eval_unary_op(self, node):
         """Evaluate unary operators"""
@@ -901,22 +976,9 @@ class Interpreter:
 
     def apply_augmented_op(self, left, op, right):
         """Apply augmented assignment operator"""
-        ops = {
-            "+=": operator.add,
-            "-=": operator.sub,
-            "*=": operator.mul,
-            "/=": operator.truediv,
-            "//=": operator.floordiv,
-            "%=": operator.mod,
-            "**=": operator.pow,
-            "&=": operator.and_,
-            "|=": operator.or_,
-            "^=": operator.xor,
-            "<<=": operator.lshift,
-            ">>=": operator.rshift,
-        }
-        if op in ops:
-            return ops[op](left, right)
+        func = AUGMENTED_OPS.get(op)
+        if func is not None:
+            return func(left, right)
         raise RuntimeError(f"Unknown augmented operator: {op}")
 
     def eval_function_call(self, node):
@@ -931,7 +993,7 @@ class Interpreter:
         # User-defined function
         elif isinstance(func, Function):
             # Check argument count with default parameters
-            required_params = sum(1 for _, _, default in func.def_node.params if default is None)
+            required_params = func.required_params
             total_params = len(func.def_node.params)
             provided_args = len(node.args)
             
@@ -952,7 +1014,7 @@ class Interpreter:
                 func_env.define(param_name, value, param_type)
             
             # Handle kwargs
-            if hasattr(node, 'kwargs') and node.kwargs:
+            if node.kwargs:
                 for name, value_expr in node.kwargs.items():
                     value = self.eval(value_expr)
                     func_env.set(name, value)
@@ -962,11 +1024,15 @@ class Interpreter:
             self.env = func_env
             
             try:
-                for stmt in func.def_node.body:
-                    self.eval(stmt)
+                for handler, stmt in func.body:
+                    handler(self, stmt)
                 return None
             except ReturnException as e:
                 return e.value
+            except (BreakException, ContinueException, RuntimeError):
+                raise
+            except Exception as e:
+                raise RuntimeError(f"Runtime error: {e}", stmt)
             finally:
                 self.env = prev_env
         
@@ -1021,4 +1087,62 @@ class Interpreter:
             if isinstance(value, Enum):
                 return value.variant_name == pattern.struct_name
         
-        return False
\ No newline at end of file
+        return False
+
+    # Node type -> evaluation method, used by eval(). Keyed on the exact
+    # class so dispatch is one dict lookup instead of an isinstance chain.
+    _handlers = {
+        Program: eval_program,
+        VarDecl: eval_var_decl,
+        Assignment: eval_assignment,
+        AugmentedAssignment: eval_augmented_assignment,
+        Identifier: eval_identifier,
+        Literal: eval_literal,
+        ArrayLiteral: eval_array_literal,
+        NullLiteral: eval_null_literal,
+        DictLiteral: eval_dict_literal,
+        TupleLiteral: eval_tuple_literal,
+        SetLiteral: eval_set_literal,
+        CharLiteral: eval_char_literal,
+        BigIntLiteral: eval_literal,
+        DecimalLiteral: eval_literal,
+        RangeLiteral: eval_range_literal,
+        StringInterpolation: eval_string_interpolation,
+        UIntLiteral: eval_uint_literal,
+        IntLiteral: eval_int_literal,
+        SizeIntLiteral: eval_size_int_literal,
+        PtrDiffLiteral: eval_ptr_diff_literal,
+        BinaryOp: eval_binary_op,
+        BinaryChain: eval_binary_chain,
+        UnaryOp: eval_unary_op,
+        TernaryOp: eval_ternary_op,
+        IfStatement: eval_if_statement,
+        WhileLoop: eval_while_loop,
+        ForLoop: eval_for_loop,
+        ForInLoop: eval_for_in_loop,
+        SwitchStatement: eval_switch_statement,
+        MatchStatement: eval_match_statement,
+        BreakStatement: eval_break_statement,
+        ContinueStatement: eval_continue_statement,
+        ReturnStatement: eval_return_statement,
+        FunctionDef: eval_function_def,
+        FunctionCall: eval_function_call,
+        LambdaExpr: eval_lambda_expr,
+        YieldStatement: eval_yield_statement,
+        AwaitExpr: eval_await_expr,
+        PrintStatement: eval_print_statement,
+        PrintfStatement: eval_printf_statement,
+        TryCatchStatement: eval_try_catch_statement,
+        ThrowStatement: eval_throw_statement,
+        StructDef: eval_struct_def,
+        TypedefStruct: eval_struct_def,
+        UnionDef: eval_union_def,
+        TypedefUnion: eval_union_def,
+        StructLiteral: eval_struct_literal,
+        EnumDef: eval_enum_def,
+        TypeAlias: eval_type_alias,
+        IndexAccess: eval_index_access,
+        MemberAccess: eval_member_access,
+        SliceAccess: eval_slice_access,
+        ImportStatement: handle_import,
+    }
@@ -1,4 +1,5 @@
 import re
+import sys
 
 TOKEN_SPEC = [
     # Numeric literals (order matters - most specific first)
@@ -50,8 +51,37 @@ TOKEN_SPEC = [
     ("MISMATCH", r"."),
 ]
 
+# Keywords set for classification. Entries are interned like the ID values
+# they are checked against.
+KEYWORDS = frozenset(sys.intern(word) for word in (
+    "dec", "if", "else", "elif", "while", "for", "in", "print", "printf",
+    "fnc", "return", "break", "continue", "switch", "case", "default",
+    "try", "catch", "throw", "match", "async", "await", "yield",
+    "import", "from", "as", "export", "const", "mut", "ref",
+    "type", "struct", "enum", "trait", "impl", "pub", "priv",
+    "static", "self", "super", "where", "unsafe", "macro", "finally",
+    "typedef", "union",
+))
+
+# Compiled once at import; tokenize() and remove_comments() run per file
+TOKEN_REGEX = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPEC))
+BLOCK_COMMENT = re.compile(r"/\*[\s\S]*?\*/")
+LINE_COMMENT = re.compile(r"//[^\n]*")
+HASH_COMMENT = re.compile(r"#[^\n]*")
+
+# Token type for each group number of TOKEN_REGEX. The group names the re
+# module hands back are fresh strings; these are interned so they are the
+# same objects as the "ID", "COMMA", ... literals the parser compares
+# against, and equality checks short-circuit on identity.
+TOKEN_KINDS = [None] * (TOKEN_REGEX.groups + 1)
+for _name, _index in TOKEN_REGEX.groupindex.items():
+    TOKEN_KINDS[_index] = sys.intern(_name)
+del _name, _index
+
 class Token:
     """Enhanced token class with position tracking"""
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, type, value, line, column):
         self.type = type
         self.value = value
@@ -72,28 +102,26 @@ def tokenize(code, track_position=True):
     Returns:
         List of tokens (tuples or Token objects)
     """
+    return list(iter_tokens(code, track_position))
+
+def iter_tokens(code, track_position=True):
+    """
+    Yield tokens one at a time instead of building the whole list.
+    
+    Parser drains this into its own per-field lists before parsing
+    starts, so parsing is not incremental; what it saves is the list of
+    Token objects that tokenize() would build and the parser would only
+    copy from. Lexer errors are raised when the offending token is
+    reached.
+    """
     # Remove comments
     code = remove_comments(code)
     
-    # Keywords set for classification
-    keywords = {
-        "dec", "if", "else", "elif", "while", "for", "in", "print", "printf",  # <-- Make sure "elif" is here
-        "fnc", "return", "break", "continue", "switch", "case", "default",
-        "try", "catch", "throw", "match", "async", "await", "yield",
-        "import", "from", "as", "export", "const", "mut", "ref",
-        "type", "struct", "enum", "trait", "impl", "pub", "priv",
-        "static", "self", "super", "where", "unsafe", "macro", "finally",
-        "typedef", "union"
-    }
-    
-    regex = "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPEC)
-    tokens = []
-    
     line = 1
     line_start = 0
     
-    for m in re.finditer(regex, code):
-        kind = m.lastgroup
+    for m in TOKEN_REGEX.finditer(code):
+        kind = TOKEN_KINDS[m.lastindex]
         value = m.group()
         column = m.start() - line_start + 1
         
@@ -106,25 +134,30 @@ def tokenize(code, track_position=True):
         elif kind == "MISMATCH":
             raise SyntaxError(f"Unexpected character '{value}' at line {line}, column {column}")
         
-        # Convert ID to KEYWORD if it's a keyword
-        if kind == "ID" and value in keywords:
-            kind = "KEYWORD"
+        # Convert ID to KEYWORD if it's a keyword. Names and operators are
+        # interned so the parser's keyword/operator checks and the
+        # interpreter's scope lookups can match on identity instead of
+        # comparing characters.
+        if kind == "ID":
+            value = sys.intern(value)
+            if value in KEYWORDS:
+                kind = "KEYWORD"
+        elif kind == "OP":
+            value = sys.intern(value)
         
         if track_position:
-            tokens.append(Token(kind, value, line, column))
+            yield Token(kind, value, line, column)
         else:
-            tokens.append((kind, value))
-    
-    return tokens
+            yield (kind, value)
 
 def remove_comments(code):
     """Remove single-line and multi-line comments from code"""
     # Multi-line comments /* ... */
-    code = re.sub(r"/\*[\s\S]*?\*/", "", code)
+    code = BLOCK_COMMENT.sub("", code)
     # Single-line comments // ...
-    code = re.sub(r"//[^\n]*", "", code)
+    code = LINE_COMMENT.sub("", code)
     # Hash-style comments # ...
-    code = re.sub(r"#[^\n]*", "", code)
+    code = HASH_COMMENT.sub("", code)
     return code
 
 def preprocess(code):
@@ -6,11 +6,23 @@ Enhanced driver with improved REPL and file execution support
 
 import sys
 import os
+import io
 import atexit
+import functools
+import hashlib
+import pickle
+import tempfile
 from pathlib import Path
-from lexer import tokenize, preprocess
-from parser_enhanced import Parser, ParseError
-from interpreter import Interpreter, RuntimeError as InterpreterRuntimeError
+from lexer import tokenize, iter_tokens, preprocess
+from parser_enhanced import Parser, ParseError, LITERAL_CONVERTERS, TYPED_CTORS
+from ast_nodes_enhanced import Identifier, Literal, Assignment
+from interpreter import Interpreter, Function, Lambda, Range, RuntimeError as InterpreterRuntimeError
+
+# run_file() keeps the parsed AST of each script in a per-user cache
+# directory. A cache is only trusted if it was written by the same
+# lexer/parser/AST modules, so their mtimes are part of its header.
+_AST_CACHE_STAMP = '.'.join(str(os.stat(sys.modules[name].__file__).st_mtime_ns)
+                            for name in ('lexer', 'parser_enhanced', 'ast_nodes_enhanced'))
 
 # Try to import readline for better REPL experience
 # Falls back gracefully if not available (e.g., on Windows)
@@ -32,58 +44,158 @@ class Colors:
     CYAN = '\033[96m'
     GRAY = '\033[90m'
 
+# Don't emit escape codes when output is piped or redirected
+if not sys.stdout.isatty():
+    for _name in ('RESET', 'BOLD', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'GRAY'):
+        setattr(Colors, _name, '')
+
+# Built-in functions defined by Interpreter.setup_builtins (print and
+# printf are keywords, so they never show up as variables)
+_BUILTIN_FUNCS = frozenset(['abs', 'int', 'float', 'str', 'len', 'max', 'min', 'sum', 'range', 'type'])
+_BUILTIN_FUNCS_STR = ', '.join(sorted(_BUILTIN_FUNCS))
+
+# REPL results of these types are not echoed (functions, lambdas and
+# ranges have no readable representation)
+_SUPPRESSED_TYPES = (Function, Lambda, Range)
+
+# Type shown by 'vars' for an untyped value, keyed on its exact class
+_VALUE_TYPE_NAMES = {
+    bool: 'bool',
+    int: 'int',
+    float: 'float',
+    str: 'string',
+    list: 'array',
+    tuple: 'tuple',
+    set: 'set',
+    dict: 'dict',
+}
+
+# History file location
+HISTORY_FILE = str(Path.home() / '.zyra_history')
+
+def save_history():
+    """Write REPL history back to HISTORY_FILE"""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
 def setup_readline():
     """Configure readline for better REPL experience (if available)"""
     if not HAS_READLINE:
         return  # Readline not available, skip setup
     
-    # History file location
-    history_file = Path.home() / '.zyra_history'
-    
     # Load history if it exists
     try:
-        if history_file.exists():
-            readline.read_history_file(history_file)
-    except Exception:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
         pass
     
     # Set history length
     readline.set_history_length(1000)
     
     # Save history on exit
-    atexit.register(lambda: readline.write_history_file(history_file))
+    atexit.register(save_history)
     
     # Enable tab completion (basic)
     readline.parse_and_bind('tab: complete')
 
+def _ast_cache_dir():
+    """Return the per-user AST cache directory, or None if it can't be used
+    
+    $XDG_CACHE_HOME/zyra (~/.cache/zyra by default), created private to
+    the user. A directory owned by someone else is never read from, since
+    the cache files are unpickled.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'zyra')
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        if hasattr(os, 'getuid') and os.stat(path).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    return path
+
+def _write_ast_cache(cache_path, header, ast):
+    """Write header + pickled AST to cache_path atomically
+    
+    The data goes to a temporary file that replaces cache_path only once
+    it is complete; on any failure (read-only disk, full disk, an AST too
+    deep to pickle) the temporary file is removed and nothing is cached.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            pickle.dump(ast, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _cached_parse(filename):
+    """Parse a source file, reusing its AST from the per-user cache
+    
+    Like a .pyc, the cache records the source's mtime and size and is only
+    used while both still match. That key is a plain-text first line,
+    checked before anything is unpickled. A missing or stale cache means a
+    normal parse, after which the cache is rewritten if possible.
+    """
+    realpath = os.path.realpath(filename)
+    st = os.stat(realpath)
+    header = (f"ZYRA-AST {_AST_CACHE_STAMP} {st.st_mtime_ns} {st.st_size} {realpath!r}\n"
+              .encode('utf-8', 'surrogateescape'))
+    
+    cache_dir = _ast_cache_dir()
+    if cache_dir is not None:
+        name = hashlib.sha256(realpath.encode('utf-8', 'surrogateescape')).hexdigest()
+        cache_path = os.path.join(cache_dir, name + '.zyc')
+        try:
+            with open(cache_path, 'rb') as f:
+                if f.readline(len(header) + 1) == header:
+                    return pickle.load(f)
+        except Exception:
+            pass  # Missing or unreadable cache; parse the source instead
+    
+    with open(realpath, 'r') as f:
+        code = f.read()
+    ast = Parser(iter_tokens(code, track_position=True)).parse()
+    
+    if cache_dir is not None:
+        _write_ast_cache(cache_path, header, ast)
+    return ast
+
 def run_file(filename, verbose=False, debug=False):
     """Execute a source file"""
     try:
-        with open(filename, 'r') as f:
-            code = f.read()
-        
         if verbose:
             print(f"{Colors.CYAN}Reading file: {filename}{Colors.RESET}")
         
-        # Optionally preprocess
-        # code = preprocess(code)
-        
-        # Tokenize
         if debug:
+            # Show every stage, so always lex and parse from source
+            with open(filename, 'r') as f:
+                code = f.read()
+            
+            # Optionally preprocess
+            # code = preprocess(code)
+            
             print(f"{Colors.GRAY}Tokenizing...{Colors.RESET}")
-        tokens = tokenize(code, track_position=True)
-        
-        if debug:
+            tokens = tokenize(code, track_position=True)
             print(f"{Colors.GRAY}Tokens: {tokens[:10]}...{Colors.RESET}")
-        
-        # Parse
-        if debug:
+            
             print(f"{Colors.GRAY}Parsing...{Colors.RESET}")
-        parser = Parser(tokens)
-        ast = parser.parse()
-        
-        if debug:
+            parser = Parser(tokens)
+            ast = parser.parse()
+            
             print(f"{Colors.GRAY}AST: {ast}{Colors.RESET}")
+        else:
+            ast = _cached_parse(filename)
         
         # Interpret
         if debug:
@@ -132,7 +244,7 @@ def repl(verbose=False):
     interpreter = Interpreter()
     
     # Track multi-line input
-    multi_line_buffer = []
+    multi_line_buffer = io.StringIO()
     in_multi_line = False
     
     while True:
@@ -147,16 +259,18 @@ def repl(verbose=False):
             line = input(prompt)
             
             # Check for multi-line continuation
-            if line.rstrip().endswith('\\'):
-                multi_line_buffer.append(line.rstrip()[:-1])
+            stripped = line.rstrip()
+            if stripped.endswith('\\'):
+                multi_line_buffer.write(stripped[:-1])
+                multi_line_buffer.write('\n')
                 in_multi_line = True
                 continue
             
             # Combine multi-line input
             if in_multi_line:
-                multi_line_buffer.append(line)
-                code = '\n'.join(multi_line_buffer)
-                multi_line_buffer = []
+                multi_line_buffer.write(line)
+                code = multi_line_buffer.getvalue()
+                multi_line_buffer = io.StringIO()
                 in_multi_line = False
             else:
                 code = line
@@ -189,15 +303,11 @@ def repl(verbose=False):
             elif code.strip() == "":
                 continue
             
-            # Tokenize
-            tokens = tokenize(code, track_position=False)
-            
-            # Parse
-            parser = Parser(tokens)
-            ast = parser.parse()
-            
-            # Eval
-            result = interpreter.eval(ast)
+            # Tokenize, parse and eval
+            ok, result = _eval_one(code, interpreter)
+            if not ok:
+                _report_error(result, verbose)
+                continue
             
             # Print (if result is not None and not a print statement)
             if result is not None and not code.strip().startswith(('print', 'printf')):
@@ -205,10 +315,8 @@ def repl(verbose=False):
                 should_suppress = (
                     # Check if it's a declaration/definition keyword
                     any(code.strip().startswith(kw) for kw in ['fnc', 'function', 'def', 'struct', 'enum', 'class', 'type', 'dec', 'const']) or
-                    # Check if result is a function/class object
-                    (hasattr(result, '__class__') and 'Function' in result.__class__.__name__) or
-                    (hasattr(result, '__class__') and 'Class' in result.__class__.__name__) or
-                    (hasattr(type(result), '__name__') and 'object at 0x' in str(result))
+                    # Check if result is a runtime object with no useful repr
+                    isinstance(result, _SUPPRESSED_TYPES)
                 )
                 
                 if not should_suppress:
@@ -219,25 +327,81 @@ def repl(verbose=False):
             break
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Interrupted{Colors.RESET}")
-            multi_line_buffer = []
+            multi_line_buffer = io.StringIO()
             in_multi_line = False
             continue
-        except ParseError as e:
-            print(f"{Colors.RED}Parse Error: {e}{Colors.RESET}")
-            multi_line_buffer = []
-            in_multi_line = False
-        except InterpreterRuntimeError as e:
-            print(f"{Colors.RED}Runtime Error: {e}{Colors.RESET}")
-            multi_line_buffer = []
-            in_multi_line = False
         except Exception as e:
-            print(f"{Colors.RED}Error: {e}{Colors.RESET}")
-            if verbose:
-                import traceback
-                traceback.print_exc()
-            multi_line_buffer = []
+            # Anything outside _eval_one (echoing a result, 'vars', ...)
+            # is reported too instead of ending the session
+            _report_error(e, verbose)
+            multi_line_buffer = io.StringIO()
             in_multi_line = False
 
+def _eval_one(code, interpreter):
+    """Tokenize, parse and evaluate one REPL entry
+    
+    Returns (ok, value): the evaluation result when ok is True, otherwise
+    the exception that stopped it, so evaluation errors don't go through
+    the REPL loop's own exception handling.
+    """
+    try:
+        return True, interpreter.eval(_parse_entry(code))
+    except Exception as e:
+        return False, e
+
+@functools.lru_cache(maxsize=256)
+def _parse_entry(code):
+    """Parse one REPL entry, reusing the AST when the same text comes back
+    
+    Lines re-run from history are common at the prompt. The interpreter
+    never mutates AST nodes, so a cached tree can be evaluated again (also
+    across 'reset'); entries that fail to parse are not cached.
+    """
+    tokens = tokenize(code, track_position=False)
+    return _fast_parse(tokens) or Parser(tokens).parse()
+
+def _fast_parse(tokens):
+    """Build the AST of a trivial REPL entry straight from its tokens
+    
+    Handles a lone literal or identifier and 'name = literal', which make
+    up most interactive input; returns None for anything else so the
+    caller falls back to the full parser.
+    """
+    if len(tokens) == 1:
+        kind, value = tokens[0]
+        if kind == "ID":
+            # A bare type constructor name (int8, usize, ...) is a parse
+            # error, which the full parser reports
+            if value in TYPED_CTORS:
+                return None
+            return Identifier(value)
+        convert = LITERAL_CONVERTERS.get(kind)
+        if convert is not None:
+            return Literal(convert(value))
+    elif len(tokens) == 3 and tokens[0][0] == "ID" and tokens[1] == ("OP", "="):
+        convert = LITERAL_CONVERTERS.get(tokens[2][0])
+        if convert is not None:
+            return Assignment(tokens[0][1], Literal(convert(tokens[2][1])))
+    return None
+
+def _report_error(err, verbose=False):
+    """Print an error returned by _eval_one or caught by the REPL loop"""
+    if isinstance(err, ParseError):
+        print(f"{Colors.RED}Parse Error: {err}{Colors.RESET}")
+    elif isinstance(err, InterpreterRuntimeError):
+        print(f"{Colors.RED}Runtime Error: {err}{Colors.RESET}")
+    else:
+        print(f"{Colors.RED}Error: {err}{Colors.RESET}")
+        if verbose:
+            import traceback
+            traceback.print_exception(type(err), err, err.__traceback__)
+
+def _builtin_names(found):
+    """Format the built-in function names found in an environment"""
+    if len(found) == len(_BUILTIN_FUNCS):
+        return _BUILTIN_FUNCS_STR
+    return ', '.join(sorted(found))
+
 def print_variables(interpreter):
     """Print current interpreter variables"""
     try:
@@ -293,7 +457,7 @@ def print_variables(interpreter):
                 # Skip built-in functions
                 if callable(actual_value) and (
                     hasattr(actual_value, '__name__') and 
-                    name in ['abs', 'int', 'float', 'str', 'len', 'max', 'min', 'sum', 'range', 'type', 'print', 'printf']
+                    name in _BUILTIN_FUNCS
                 ):
                     builtin_funcs.add(name)
                     continue
@@ -304,31 +468,18 @@ def print_variables(interpreter):
                 user_vars[name] = (value, None, False)
         
         if user_vars:
-            print(f"{Colors.BOLD}User-Defined Variables:{Colors.RESET}")
+            # Collect the listing and write it in one go instead of one
+            # print() per variable
+            lines = [f"{Colors.BOLD}User-Defined Variables:{Colors.RESET}"]
             for name, (value, var_type, is_const) in sorted(user_vars.items()):
                 # Determine the type to display
                 if var_type:
-                    type_str = f"{Colors.BLUE}{var_type}{Colors.RESET}"
+                    type_name = var_type
                 elif callable(value):
-                    type_str = f"{Colors.BLUE}function{Colors.RESET}"
-                elif isinstance(value, bool):
-                    type_str = f"{Colors.BLUE}bool{Colors.RESET}"
-                elif isinstance(value, int):
-                    type_str = f"{Colors.BLUE}int{Colors.RESET}"
-                elif isinstance(value, float):
-                    type_str = f"{Colors.BLUE}float{Colors.RESET}"
-                elif isinstance(value, str):
-                    type_str = f"{Colors.BLUE}string{Colors.RESET}"
-                elif isinstance(value, list):
-                    type_str = f"{Colors.BLUE}array{Colors.RESET}"
-                elif isinstance(value, tuple):
-                    type_str = f"{Colors.BLUE}tuple{Colors.RESET}"
-                elif isinstance(value, set):
-                    type_str = f"{Colors.BLUE}set{Colors.RESET}"
-                elif isinstance(value, dict):
-                    type_str = f"{Colors.BLUE}dict{Colors.RESET}"
+                    type_name = 'function'
                 else:
-                    type_str = f"{Colors.BLUE}auto{Colors.RESET}"
+                    type_name = _VALUE_TYPE_NAMES.get(type(value), 'auto')
+                type_str = f"{Colors.BLUE}{type_name}{Colors.RESET}"
                 
                 # Add const marker if needed
                 if is_const:
@@ -363,14 +514,15 @@ def print_variables(interpreter):
                     else:
                         val_str = f"{Colors.CYAN}{value}{Colors.RESET}"
                 
-                print(f"  {type_str} {Colors.YELLOW}{name}{Colors.RESET} = {val_str}")
+                lines.append(f"  {type_str} {Colors.YELLOW}{name}{Colors.RESET} = {val_str}")
             
             if builtin_funcs:
-                print(f"\n{Colors.GRAY}Built-in functions: {', '.join(sorted(builtin_funcs))}{Colors.RESET}")
+                lines.append(f"\n{Colors.GRAY}Built-in functions: {_builtin_names(builtin_funcs)}{Colors.RESET}")
+            print("\n".join(lines))
         else:
             print(f"{Colors.GRAY}No user-defined variables{Colors.RESET}")
             if builtin_funcs:
-                print(f"{Colors.GRAY}Built-in functions available: {', '.join(sorted(builtin_funcs))}{Colors.RESET}")
+                print(f"{Colors.GRAY}Built-in functions available: {_builtin_names(builtin_funcs)}{Colors.RESET}")
             
     except Exception as e:
         print(f"{Colors.RED}Error displaying variables: {e}{Colors.RESET}")
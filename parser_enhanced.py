@@ -1,240 +1,389 @@
+from itertools import chain
+
 from ast_nodes_enhanced import *
+from lexer import Token
+
+__all__ = ["Parser", "ParseError", "LITERAL_CONVERTERS", "TYPED_CTORS"]
 
 class ParseError(Exception):
     """Custom parse error with position info"""
     def __init__(self, message, token=None):
+        super().__init__(message)
         self.message = message
         self.token = token
-        if token and hasattr(token, 'line'):
-            super().__init__(f"{message} at line {token.line}, column {token.column}")
-        else:
-            super().__init__(message)
+        self.line = getattr(token, 'line', None)
+        self.column = getattr(token, 'column', None)
+
+    def __str__(self):
+        # Formatted only when shown; errors caught and discarded never pay
+        # for it
+        if self.line is not None:
+            return f"{self.message} at line {self.line}, column {self.column}"
+        return self.message
+
+# Binary operator precedence, loosest first. Operators are matched on the
+# token value alone, so word operators (and, or, ...) work even though the
+# lexer emits them as identifiers.
+PRECEDENCE = {
+    "or": 1, "xor": 1, "||": 1,
+    "and": 2, "&&": 2,
+    "then": 3,
+    "nand": 4,
+    "==": 5, "!=": 5, "<": 5, ">": 5, "<=": 5, ">=": 5,
+    "in": 5, "<=>": 5, "===": 5, "!==": 5,
+    "|": 6,
+    "^": 7,
+    "&": 8,
+    "<<": 9, ">>": 9,
+    "..": 10, "..=": 10,
+    "+": 11, "-": 11,
+    "*": 12, "/": 12, "%": 12, "//": 12,
+    "**": 13,
+}
+RANGE_PREC = 10
+POWER_PREC = 13
+
+# Symbolic spellings that the interpreter knows under their word names
+OP_ALIASES = {"||": "or", "&&": "and"}
+
+def _based_int(text):
+    return int(text, 0)  # Auto-detect base from the 0x/0o/0b prefix
+
+# Token type -> conversion from token text to the Literal's value
+LITERAL_CONVERTERS = {
+    "NUMBER": int,  # the lexer emits fractional numbers as FLOAT
+    "FLOAT": float,
+    "INT_HEX": _based_int,
+    "INT_OCTAL": _based_int,
+    "INT_BINARY": _based_int,
+    "BOOL": lambda text: text == "true",
+    "STRING": lambda text: text.strip('"'),
+}
+
+# Literals common enough to share between parses; every Parser's literal
+# cache starts from these
+COMMON_LITERALS = {
+    ("NUMBER", "0"): Literal(0),
+    ("NUMBER", "1"): Literal(1),
+    ("BOOL", "true"): Literal(True),
+    ("BOOL", "false"): Literal(False),
+    ("STRING", '""'): Literal(""),
+}
+
+# Statements made of a keyword and a value: node class, and whether the
+# value may be left out
+KEYWORD_STMTS = {
+    "return": (ReturnStatement, True),
+    "break": (BreakStatement, True),
+    "throw": (ThrowStatement, False),
+    "yield": (YieldStatement, False),
+}
+
+# Left-associative operators whose same-operator runs are built as a
+# BinaryChain. ** is right-associative and comparisons/ranges keep their
+# pairwise nodes.
+CHAIN_OPS = frozenset((
+    "+", "-", "*", "/", "//", "%",
+    "&", "|", "^", "<<", ">>",
+    "and", "or", "xor",
+))
+
+# Prefix operator token -> UnaryOp operator
+PREFIX_OPS = {
+    "+": "+", "-": "-", "~": "~",
+    "!": "not", "not": "not",
+    "++": "++", "--": "--",
+}
+
+# Token sets used for membership tests in the parser
+ASSIGN_OPS = frozenset(("=", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "<<=", ">>=", "**="))
+STMT_END_TYPES = frozenset(("SEMICOL", "RBRACE", None))
+NAME_TYPES = frozenset(("ID", "KEYWORD"))
+INCDEC_OPS = frozenset(("++", "--"))
+SWITCH_LABELS = frozenset(("case", "default"))
+MATCH_SUBJECT_TYPES = frozenset(("NUMBER", "STRING", "BOOL", "NULL"))
+PATTERN_LITERAL_TYPES = frozenset(("NUMBER", "BOOL", "NULL", "CHAR", "STRING"))
+SLICE_END_TYPES = frozenset(("COLON", "RBRACKET"))
+
+# Typed integer constructors, e.g. int8(x): name -> (node class, arguments
+# that follow the wrapped expression)
+TYPED_CTORS = {"usize": (SizeIntLiteral, (False,)),
+               "isize": (SizeIntLiteral, (True,)),
+               "ptrdiff": (PtrDiffLiteral, ())}
+for _bits in (8, 16, 32, 64, 128, 256):
+    TYPED_CTORS[f"int{_bits}"] = (IntLiteral, (_bits, True))
+    TYPED_CTORS[f"uint{_bits}"] = (UIntLiteral, (_bits,))
+del _bits
 
 class Parser:
+    # Fixed attribute layout: slot access is cheaper than an instance dict
+    __slots__ = ('pos', 'n', 'types', 'values', 'lines', 'columns',
+                 'no_struct_literal', 'literal_cache', 'identifier_cache')
+
+    # Padding past the last token so lookahead never needs a bounds check
+    LOOKAHEAD = 4
+
     def __init__(self, tokens):
-        self.tokens = tokens
         self.pos = 0
+        self.no_struct_literal = False
+        # Shared Literal/Identifier nodes, keyed by token and by name
+        self.literal_cache = dict(COMMON_LITERALS)
+        self.identifier_cache = {}
+        # Token types and values live in parallel lists; most lookups
+        # only need one of the two fields. tokens may be a list or an
+        # iterator such as lexer.iter_tokens(); it is read to the end
+        # here, and only the fields are kept, not the tokens themselves
+        # (positions are for error messages).
+        types = self.types = []
+        values = self.values = []
+        lines = self.lines = []
+        columns = self.columns = []
+        tokens = iter(tokens)
+        first = next(tokens, None)
+        add_type = types.append
+        add_value = values.append
+        if hasattr(first, 'type'):
+            add_line = lines.append
+            add_column = columns.append
+            for tok in chain((first,), tokens):
+                add_type(tok.type)
+                add_value(tok.value)
+                add_line(tok.line)
+                add_column(tok.column)
+        elif first is not None:
+            for tok_type, tok_val in chain((first,), tokens):
+                add_type(tok_type)
+                add_value(tok_val)
+        self.n = len(types)
+        padding = [None] * self.LOOKAHEAD
+        types.extend(padding)
+        values.extend(padding)
 
     def peek(self, offset=0):
         """Peek ahead at tokens"""
         idx = self.pos + offset
-        if idx < len(self.tokens):
-            token = self.tokens[idx]
-            return (token.type, token.value) if hasattr(token, 'type') else token
+        if idx < self.n:
+            return (self.types[idx], self.values[idx])
         return (None, None)
 
-    def consume(self, expected_type=None, expected_value=None):
-        """Consume a token with optional validation"""
-        tok = self.peek()
-        if expected_type and tok[0] != expected_type:
-            raise ParseError(f"Expected {expected_type}, got {tok[0]}", 
-                           self.tokens[self.pos] if self.pos < len(self.tokens) else None)
-        if expected_value and tok[1] != expected_value:
-            raise ParseError(f"Expected '{expected_value}', got '{tok[1]}'",
-                           self.tokens[self.pos] if self.pos < len(self.tokens) else None)
-        self.pos += 1
-        return tok
+    # The current token is read inline as self.types[self.pos] /
+    # self.values[self.pos]; these are for looking further ahead
+
+    def peek_type(self, offset=0):
+        """Type of the token offset places ahead
+
+        None for up to LOOKAHEAD positions past the last token; further
+        than that raises IndexError.
+        """
+        return self.types[self.pos + offset]
+
+    def peek_val(self, offset=0):
+        """Value of the token offset places ahead
+
+        None for up to LOOKAHEAD positions past the last token; further
+        than that raises IndexError.
+        """
+        return self.values[self.pos + offset]
+
+    def _current_token(self):
+        pos = self.pos
+        if pos >= self.n:
+            return None
+        if self.lines:
+            return Token(self.types[pos], self.values[pos],
+                         self.lines[pos], self.columns[pos])
+        return (self.types[pos], self.values[pos])
+
+    def _advance(self):
+        """Consume the current token without validation"""
+        pos = self.pos
+        self.pos = pos + 1
+        return (self.types[pos], self.values[pos])
+
+    def _expect_type(self, expected_type):
+        """Consume a token that must be of the given type"""
+        pos = self.pos
+        tok_type = self.types[pos]
+        if tok_type != expected_type:
+            raise ParseError(f"Expected {expected_type}, got {tok_type}",
+                           self._current_token())
+        self.pos = pos + 1
+        return (tok_type, self.values[pos])
+
+    def _expect_name(self, what):
+        """Consume an ID or KEYWORD token used as a name (e.g. "type")"""
+        pos = self.pos
+        if self.types[pos] not in NAME_TYPES:
+            raise ParseError(f"Expected {what}, got {self.peek()}")
+        self.pos = pos + 1
+        return self.values[pos]
+
+    def _expect_value(self, expected_value):
+        """Consume a token that must have the given value (a keyword or
+        operator; the value alone identifies it)"""
+        pos = self.pos
+        tok_val = self.values[pos]
+        if tok_val != expected_value:
+            raise ParseError(f"Expected '{expected_value}', got '{tok_val}'",
+                           self._current_token())
+        self.pos = pos + 1
+        return tok_val
+
+    def _allow_struct_literals(self, parse, *args):
+        """Run parse(*args) with struct literals re-enabled
+
+        for_stmt turns them off for the top level of a for-in iterable;
+        inside brackets, parentheses and call arguments a '{' can no
+        longer start the loop body, so they are parsed normally again.
+        """
+        self.no_struct_literal = False
+        try:
+            return parse(*args)
+        finally:
+            self.no_struct_literal = True
 
     def parse(self):
         """Parse entire program"""
         statements = []
-        while self.peek()[0] is not None:
-            statements.append(self.statement())
-        return Program(statements)
+        append = statements.append
+        types = self.types
+        statement = self.statement
+        while types[self.pos] is not None:
+            append(statement())
+        # Statement lists are never modified after parsing; tuples drop
+        # the list's over-allocation
+        return Program(tuple(statements))
 
     def statement(self):
         """Parse a single statement"""
-        tok = self.peek()
-        keyword = tok[1] if tok[0] == "KEYWORD" else None
-        
-        # Keywords
-        if keyword == "dec":
-            return self.var_decl()
-        elif keyword == "const":
-            return self.const_decl()
-        elif keyword == "if":
-            return self.if_stmt()
-        elif keyword == "while":
-            return self.while_stmt()
-        elif keyword == "for":
-            return self.for_stmt()
-        elif keyword == "print":
-            return self.print_stmt()
-        elif keyword == "printf":
-            return self.printf_stmt()
-        elif keyword == "fnc":
-            return self.function_def()
-        elif keyword == "return":
-            self.consume("KEYWORD", "return")
-            expr = self.expr() if self.peek()[0] not in ("SEMICOL", "RBRACE", None) else None
-            return ReturnStatement(expr)
-        elif keyword == "break":
-            self.consume("KEYWORD", "break")
-            value = self.expr() if self.peek()[0] not in ("SEMICOL", "RBRACE", None) else None
-            return BreakStatement(value)
-        elif keyword == "continue":
-            self.consume("KEYWORD", "continue")
-            return ContinueStatement()
-        elif keyword == "switch":
-            return self.switch_stmt()
-        elif keyword == "match":
-            return self.match_stmt()
-        elif keyword == "try":
-            return self.try_catch_stmt()
-        elif keyword == "throw":
-            self.consume("KEYWORD", "throw")
-            expr = self.expr()
-            return ThrowStatement(expr)
-        elif keyword == "typedef":
-            next_tok = self.peek(1)  # ← Look at the NEXT token, not current!
-            if next_tok[1] == "union":
-                return self.typedef_union()
-            else:
-                return self.typedef_struct()
-        elif keyword == "union":
-            return self.union_def()
-            return self.typedef_struct()
-        elif keyword == "struct":
-            return self.struct_def()
-        elif keyword == "enum":
-            return self.enum_def()
-        elif keyword == "type":
-            return self.type_alias()
-        elif keyword == "from":
-            return self.from_import_stmt()
-        elif keyword == "import":
-            return self.import_stmt()
-        elif keyword == "yield":
-            self.consume("KEYWORD", "yield")
-            expr = self.expr()
-            return YieldStatement(expr)
-        else:
-            return self.assignment_or_expr()
+        # Declarations and assignment/call statements are the most common
+        # statement starts in practice, so they skip the table lookup
+        tok_type = self.types[self.pos]
+        if tok_type == "KEYWORD":
+            keyword = self.values[self.pos]
+            if keyword == "dec":
+                return self.var_decl()
+            handler = self._STMT_DISPATCH.get(keyword)
+            if handler is not None:
+                return handler(self)
+        return self.assignment_or_expr()
+
+    def keyword_stmt(self):
+        """Parse return/break/throw/yield: the keyword followed by a value,
+        which return and break may leave out (see KEYWORD_STMTS)"""
+        node_class, optional = KEYWORD_STMTS[self.values[self.pos]]
+        self.pos += 1
+        if optional and not self._has_stmt_value():
+            return node_class(None)
+        return node_class(self.expr())
+
+    def _has_stmt_value(self):
+        """Whether return/break is followed by a value rather than the end
+        of the statement (including the next case label in a switch)"""
+        return (self.types[self.pos] not in STMT_END_TYPES
+                and self.values[self.pos] not in SWITCH_LABELS)
+
+    def continue_stmt(self):
+        """Parse continue statement"""
+        self._advance()  # 'continue'
+        return ContinueStatement()
+
+    def typedef_stmt(self):
+        """Parse typedef struct or typedef union"""
+        if self.peek_val(1) == "union":  # Look at the token after 'typedef'
+            return self.typedef_union()
+        return self.typedef_struct()
 
     def block(self):
         """Parse a block of statements"""
-        self.consume("LBRACE")
+        self._expect_type("LBRACE")
         stmts = []
-        while self.peek()[0] != "RBRACE":
-            if self.peek()[0] is None:
+        append = stmts.append
+        types = self.types
+        statement = self.statement
+        while types[self.pos] != "RBRACE":
+            if types[self.pos] is None:
                 raise ParseError("Unexpected end of input, expected '}'")
-            stmts.append(self.statement())
-        self.consume("RBRACE")
-        return stmts
+            append(statement())
+        self._expect_type("RBRACE")
+        return tuple(stmts)
     
-    def import_stmt(self):
-        """Parse import statement with file path support"""
-        self.consume("KEYWORD", "import")
-        
-        # from 'file.zy' import name1, name2
-        if self.peek()[1] == "from":
-            raise ParseError("Syntax error: use 'from' after module path")
-        
-        # Check if next token is a string (file path)
-        tok = self.peek()
-        
-        if tok[0] == "STRING":
-            # import 'file.zy' [as alias]
-            filepath = self.consume("STRING")[1].strip('"\'')
-            
-            alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
-            
-            return ImportStatement(filepath, names=None, alias=alias)
-        
-        elif tok[0] == "ID":
-            # Legacy support: import module or from module import x
-            module = self.consume("ID")[1]
-            
-            # Check for 'from' after module name (from module import x)
-            if self.peek()[1] == "import":
-                # This is actually: import module; we'll treat module as a file
-                return ImportStatement(module + ".zy", names=None, alias=None)
-            
-            alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
-            
-            return ImportStatement(module + ".zy", names=None, alias=alias)
-        
-        else:
-            raise ParseError(f"Expected string or identifier after 'import', got {tok}")
-
     def from_import_stmt(self):
         """Parse 'from X import Y' statement"""
-        self.consume("KEYWORD", "from")
+        self._advance()  # 'from'
     
-        tok = self.peek()
-        if tok[0] == "STRING":
-            filepath = self.consume("STRING")[1].strip('"\'')
-        elif tok[0] == "ID":
-            filepath = self.consume("ID")[1] + ".zy"
+        tok_type = self.types[self.pos]
+        if tok_type == "STRING":
+            filepath = self._advance()[1].strip('"\'')
+        elif tok_type == "ID":
+            filepath = self._advance()[1] + ".zy"
         else:
-            raise ParseError(f"Expected string or identifier after 'from', got {tok}")
+            raise ParseError(f"Expected string or identifier after 'from', got {self.peek()}")
     
-        self.consume("KEYWORD", "import")
+        self._expect_value("import")
     
         names = []
         while True:
-            names.append(self.consume("ID")[1])
-            if self.peek()[0] != "COMMA":
+            names.append(self._expect_type("ID")[1])
+            if self.types[self.pos] != "COMMA":
                 break
-            self.consume("COMMA")
+            self._expect_type("COMMA")
     
         return ImportStatement(filepath, names=names, alias=None)
     
     def var_decl(self):
         """Parse variable declaration"""
-        self.consume("KEYWORD", "dec")
+        self._advance()  # 'dec'
         
         # Check for mutability modifiers
         is_mut = True
-        if self.peek()[1] == "mut":
-            self.consume()
+        if self.values[self.pos] == "mut":
+            self._advance()
             is_mut = True
         
-        first_id = self.consume("ID")[1]
+        first_id = self._expect_type("ID")[1]
 
         # Typed declaration: dec uint8 x = expr
-        if self.peek()[0] == "ID":
+        if self.types[self.pos] == "ID":
             var_type = first_id
-            name = self.consume("ID")[1]
-            self.consume("OP", "=")
+            name = self._expect_type("ID")[1]
+            self._expect_value("=")
             value = self.expr()
             return VarDecl(var_type, name, value, is_mut=is_mut)
         # Untyped declaration: dec x = expr
         else:
             name = first_id
-            self.consume("OP", "=")
+            self._expect_value("=")
             value = self.expr()
             return VarDecl(None, name, value, is_mut=is_mut)
 
     def const_decl(self):
         """Parse constant declaration"""
-        self.consume("KEYWORD", "const")
-        name = self.consume("ID")[1]
+        self._advance()  # 'const'
+        name = self._expect_type("ID")[1]
         
         var_type = None
-        if self.peek()[0] == "COLON":
-            self.consume("COLON")
-            var_type = self.consume("ID")[1]
+        if self.types[self.pos] == "COLON":
+            self._expect_type("COLON")
+            var_type = self._expect_type("ID")[1]
         
-        self.consume("OP", "=")
+        self._expect_value("=")
         value = self.expr()
         return VarDecl(var_type, name, value, is_const=True, is_mut=False)
 
     def assignment_or_expr(self):
         """Parse assignment or expression statement"""
-        tok = self.peek()
-
-        if tok[0] == "ID":
-            # Look ahead to determine if it's an assignment
-            if self.peek(1)[1] in ["=", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "<<=", ">>=", "**="]:
-                name = self.consume("ID")[1]
-                op = self.consume()[1]
+        pos = self.pos
+        types = self.types
+
+        if types[pos] == "ID":
+            values = self.values
+            # Look ahead to determine if it's an assignment; the name and
+            # operator are already known, so step over both at once
+            op = values[pos + 1]
+            if op in ASSIGN_OPS:
+                name = values[pos]
+                self.pos = pos + 2
                 value = self.expr()
                 
                 if op == "=":
@@ -242,13 +391,15 @@ class Parser:
                 else:
                     return AugmentedAssignment(name, op, value)
             # Check for member access assignment: obj.field = value
-            elif self.peek(1)[0] == "DOT":
-                expr = self.expr()
-                if self.peek()[1] == "=":
-                    self.consume("OP", "=")
+            elif types[pos + 1] == "DOT":
+                # Only a postfix chain can be assigned to, so parse just
+                # that before deciding
+                target = self.postfix()
+                if self.values[self.pos] == "=":
+                    self._advance()  # '='
                     value = self.expr()
-                    return Assignment(expr, value)
-                return expr
+                    return Assignment(target, value)
+                return self.expr(target)
         
         # Otherwise just an expression
         return self.expr()
@@ -256,56 +407,58 @@ class Parser:
     def if_stmt(self):
         """Parse if statement with elif support"""
         # Handle both 'if' and 'elif'
-        tok = self.peek()
-        if tok[1] == "elif":
-            self.consume("KEYWORD", "elif")
-        else:
-            self.consume("KEYWORD", "if")
+        self._advance()
         
-        self.consume("LPAREN")
+        self._expect_type("LPAREN")
         condition = self.expr()
-        self.consume("RPAREN")
+        self._expect_type("RPAREN")
         then_body = self.block()
         
         else_body = None
-        if self.peek()[1] == "elif":
+        if self.values[self.pos] == "elif":
             # Recursively parse elif as nested if
             else_body = [self.if_stmt()]
-        elif self.peek()[1] == "else":
-            self.consume("KEYWORD", "else")
+        elif self.values[self.pos] == "else":
+            self._advance()  # 'else'
             else_body = self.block()
         
         return IfStatement(condition, then_body, else_body)
 
     def while_stmt(self):
         """Parse while loop"""
-        self.consume("KEYWORD", "while")
-        self.consume("LPAREN")
+        self._advance()  # 'while'
+        self._expect_type("LPAREN")
         condition = self.expr()
-        self.consume("RPAREN")
+        self._expect_type("RPAREN")
         body = self.block()
         return WhileLoop(condition, body)
 
     def for_stmt(self):
         """Parse for loop (C-style or for-in)"""
-        self.consume("KEYWORD", "for")
+        self._advance()  # 'for'
     
         # C-style for loop
-        if self.peek()[0] == "LPAREN":
-            self.consume("LPAREN")
+        if self.types[self.pos] == "LPAREN":
+            self._expect_type("LPAREN")
             init = self.assignment_or_expr()
-            self.consume("SEMICOL")
+            self._expect_type("SEMICOL")
             condition = self.expr()
-            self.consume("SEMICOL")
+            self._expect_type("SEMICOL")
             update = self.assignment_or_expr()
-            self.consume("RPAREN")
+            self._expect_type("RPAREN")
             body = self.block()
             return ForLoop(init, condition, update, body)
         # For-in loop
-        elif self.peek()[0] == "ID":
-            var_name = self.consume("ID")[1]
-            self.consume("KEYWORD", "in")
-            iterable = self.expr()
+        elif self.types[self.pos] == "ID" and self.peek_val(1) == "in":
+            var_name = self._expect_type("ID")[1]
+            self._advance()  # 'in'
+            # A name right before the body would otherwise be read as a
+            # struct literal: for x in items { ... }
+            self.no_struct_literal = True
+            try:
+                iterable = self.expr()
+            finally:
+                self.no_struct_literal = False
             body = self.block()
             return ForInLoop(var_name, iterable, body)
         else:
@@ -313,889 +466,796 @@ class Parser:
 
     def switch_stmt(self):
         """Parse switch statement"""
-        self.consume("KEYWORD", "switch")
-        self.consume("LPAREN")
+        self._advance()  # 'switch'
+        self._expect_type("LPAREN")
         expr = self.expr()
-        self.consume("RPAREN")
-        self.consume("LBRACE")
+        self._expect_type("RPAREN")
+        self._expect_type("LBRACE")
 
         cases = []
+        add_case = cases.append
         default_body = None
-
-        while self.peek()[0] != "RBRACE":
-            tok = self.peek()
-            if tok[1] == "case":
-                self.consume("KEYWORD", "case")
+        types = self.types
+        values = self.values
+        statement = self.statement
+
+        while types[self.pos] != "RBRACE":
+            label = values[self.pos]
+            if label == "case":
+                self._advance()  # 'case'
                 case_expr = self.expr()
-                self.consume("COLON")
+                self._expect_type("COLON")
                 body = []
-                while self.peek()[1] not in ("case", "default") and self.peek()[0] != "RBRACE":
-                    body.append(self.statement())
-                cases.append((case_expr, body))
-            elif tok[1] == "default":
-                self.consume("KEYWORD", "default")
-                self.consume("COLON")
+                append = body.append
+                while values[self.pos] not in SWITCH_LABELS and types[self.pos] != "RBRACE":
+                    append(statement())
+                add_case((case_expr, body))
+            elif label == "default":
+                self._advance()  # 'default'
+                self._expect_type("COLON")
                 default_body = []
-                while self.peek()[0] != "RBRACE" and self.peek()[1] != "case":
-                    default_body.append(self.statement())
+                append = default_body.append
+                while types[self.pos] != "RBRACE" and values[self.pos] != "case":
+                    append(statement())
             else:
-                raise ParseError(f"Unexpected token in switch: {tok}")
+                raise ParseError(f"Unexpected token in switch: {self.peek()}")
             
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return SwitchStatement(expr, cases, default_body)
 
     def match_stmt(self):
         """Parse pattern matching statement"""
-        self.consume("KEYWORD", "match")
+        self._advance()  # 'match'
         # Parse just the value to match on (identifier or literal)
-        tok = self.peek()
-        if tok[0] == "ID":
-            expr = Identifier(self.consume("ID")[1])
-        elif tok[0] in ("NUMBER", "STRING", "BOOL", "NULL"):
+        tok_type = self.types[self.pos]
+        if tok_type == "ID":
+            expr = Identifier(self._advance()[1])
+        elif tok_type in MATCH_SUBJECT_TYPES:
             expr = self.primary()
         else:
-            raise ParseError(f"Expected identifier or literal in match, got {tok}")
+            raise ParseError(f"Expected identifier or literal in match, got {self.peek()}")
         
-        self.consume("LBRACE")
+        self._expect_type("LBRACE")
         
         arms = []
-        while self.peek()[0] != "RBRACE":
+        add_arm = arms.append
+        while self.types[self.pos] != "RBRACE":
             pattern = self.pattern()
             guard = None
             
             # Optional guard: if condition
-            if self.peek()[1] == "if":
-                self.consume("KEYWORD", "if")
+            if self.values[self.pos] == "if":
+                self._advance()  # 'if'
                 guard = self.expr()
             
-            self.consume("OP", "=>")
+            self._expect_value("=>")
             
             # Body can be expression or block
-            if self.peek()[0] == "LBRACE":
+            if self.types[self.pos] == "LBRACE":
                 body = self.block()
             else:
                 body = [self.expr()]
             
-            arms.append((pattern, guard, body))
+            add_arm((pattern, guard, body))
             
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+                self._expect_type("COMMA")
         
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return MatchStatement(expr, arms)
 
     def pattern(self):
         """Parse a pattern for match expressions"""
-        tok = self.peek()
+        tok_type = self.types[self.pos]
+        tok_val = self.values[self.pos]
         
         # Literal patterns - wrap in Literal node
-        if tok[0] in ("NUMBER", "BOOL", "NULL", "CHAR", "STRING"):
-            if tok[0] == "NUMBER":
-                self.consume()
-                value = int(tok[1]) if "." not in tok[1] else float(tok[1])
-                return Literal(value)
-            elif tok[0] == "BOOL":
-                self.consume()
-                return Literal(True if tok[1] == "true" else False)
-            elif tok[0] == "NULL":
-                self.consume()
+        if tok_type in PATTERN_LITERAL_TYPES:
+            # Numbers and bools share the decoded, cached nodes of
+            # ordinary literals
+            if tok_type == "NUMBER" or tok_type == "BOOL":
+                return self.scalar_literal()
+            self._advance()
+            if tok_type == "NULL":
                 return NullLiteral()
-            elif tok[0] in ("CHAR", "STRING"):
-                self.consume()
-                return Literal(tok[1].strip('"\''))
+            else:  # CHAR or STRING
+                return Literal(tok_val.strip('"\''))
         # Wildcard pattern
-        elif tok[1] == "_":
-            self.consume()
+        elif tok_val == "_":
+            self._advance()
             return Identifier("_")
         # Variable binding or enum variant
-        elif tok[0] == "ID":
-            name = self.consume("ID")[1]
+        elif tok_type == "ID":
+            name = self._advance()[1]
             # Enum variant with data
-            if self.peek()[0] == "LPAREN":
-                self.consume("LPAREN")
+            if self.types[self.pos] == "LPAREN":
+                self._expect_type("LPAREN")
                 inner_patterns = []
-                while self.peek()[0] != "RPAREN":
+                while self.types[self.pos] != "RPAREN":
                     inner_patterns.append(self.pattern())
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                self.consume("RPAREN")
+                    if self.types[self.pos] == "COMMA":
+                        self._expect_type("COMMA")
+                self._expect_type("RPAREN")
                 return StructLiteral(name, inner_patterns)
             return Identifier(name)
         # Tuple pattern
-        elif tok[0] == "LPAREN":
+        elif tok_type == "LPAREN":
             return self.tuple_literal()
         # Array pattern
-        elif tok[0] == "LBRACKET":
+        elif tok_type == "LBRACKET":
             return self.array_literal()
         else:
-            raise ParseError(f"Invalid pattern: {tok}")
+            raise ParseError(f"Invalid pattern: {(tok_type, tok_val)}")
 
     def try_catch_stmt(self):
         """Parse try-catch with multiple catch clauses"""
-        self.consume("KEYWORD", "try")
+        self._advance()  # 'try'
         try_block = self.block()
 
         catch_clauses = []
-        while self.peek()[1] == "catch":
-            self.consume("KEYWORD", "catch")
+        while self.values[self.pos] == "catch":
+            self._advance()  # 'catch'
             
             exception_type = None
             catch_var = None
             
-            if self.peek()[0] == "LPAREN":
-                self.consume("LPAREN")
+            if self.types[self.pos] == "LPAREN":
+                self._expect_type("LPAREN")
                 # Can specify exception type
-                if self.peek(1)[0] == "ID":
-                    exception_type = self.consume("ID")[1]
-                catch_var = self.consume("ID")[1]
-                self.consume("RPAREN")
+                if self.peek_type(1) == "ID":
+                    exception_type = self._expect_type("ID")[1]
+                catch_var = self._expect_type("ID")[1]
+                self._expect_type("RPAREN")
             
             catch_block = self.block()
             catch_clauses.append((exception_type, catch_var, catch_block))
 
         finally_block = None
-        if self.peek()[1] == "finally":
-            self.consume("KEYWORD", "finally")
+        if self.values[self.pos] == "finally":
+            self._advance()  # 'finally'
             finally_block = self.block()
 
         return TryCatchStatement(try_block, catch_clauses, finally_block)
     
     def typedef_struct(self):
         """Parse typedef struct definition"""
-        self.consume("KEYWORD", "typedef")
-        self.consume("KEYWORD", "struct")
-        name = self.consume("ID")[1]
-        self.consume("LBRACE")
+        self._advance()  # 'typedef'
+        self._expect_value("struct")
+        name = self._expect_type("ID")[1]
+        self._expect_type("LBRACE")
     
         fields = []
-        while self.peek()[0] != "RBRACE":
+        while self.types[self.pos] != "RBRACE":
             # Check for anonymous union FIRST before trying to parse field name
-            if self.peek()[0] == "KEYWORD" and self.peek()[1] == "union":
-                self.consume("KEYWORD", "union")
-                self.consume("LBRACE")
+            if self.values[self.pos] == "union":
+                self._advance()  # 'union'
+                self._expect_type("LBRACE")
                 union_fields = []
-                while self.peek()[0] != "RBRACE":
+                while self.types[self.pos] != "RBRACE":
                     # Field name can be ID or KEYWORD (e.g., "type")
-                    tok = self.peek()
-                    if tok[0] in ("ID", "KEYWORD"):
-                        union_field_name = self.consume()[1]
-                    else:
-                        raise ParseError(f"Expected field name, got {tok}")
-                    self.consume("COLON")
+                    union_field_name = self._expect_name("field name")
+                    self._expect_type("COLON")
                     # Type can be ID or KEYWORD (e.g., int32, float32)
-                    tok = self.peek()
-                    if tok[0] in ("ID", "KEYWORD"):
-                        union_field_type = self.consume()[1]
-                    else:
-                        raise ParseError(f"Expected type name, got {tok}")
+                    union_field_type = self._expect_name("type name")
                     union_fields.append((union_field_name, union_field_type))
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                self.consume("RBRACE")
+                    if self.types[self.pos] == "COMMA":
+                        self._expect_type("COMMA")
+                self._expect_type("RBRACE")
                 # Add anonymous union as a special field
                 fields.append(("__union__", AnonymousUnion(union_fields), None))
             else:
                 # Regular field - field name can be ID or KEYWORD (e.g., "type")
-                tok = self.peek()
-                if tok[0] in ("ID", "KEYWORD"):
-                    field_name = self.consume()[1]
-                else:
-                    raise ParseError(f"Expected field name, got {tok}")
-                self.consume("COLON")
+                field_name = self._expect_name("field name")
+                self._expect_type("COLON")
                 # Type can be ID or KEYWORD (e.g., uint8, String, int32)
-                tok = self.peek()
-                if tok[0] in ("ID", "KEYWORD"):
-                    field_type = self.consume()[1]
-                else:
-                    raise ParseError(f"Expected type name, got {tok}")
+                field_type = self._expect_name("type name")
 
                 default_value = None
-                if self.peek()[1] == "=":
-                    self.consume("OP", "=")
+                if self.values[self.pos] == "=":
+                    self._advance()  # '='
                     default_value = self.expr()
 
                 fields.append((field_name, field_type, default_value))
 
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+                self._expect_type("COMMA")
 
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return TypedefStruct(name, fields)
     
     def union_def(self):
         """Parse union definition"""
-        self.consume("KEYWORD", "union")
-        name = self.consume("ID")[1]
-        self.consume("LBRACE")
+        self._advance()  # 'union'
+        name = self._expect_type("ID")[1]
+        self._expect_type("LBRACE")
     
         fields = []
-        while self.peek()[0] != "RBRACE":
+        while self.types[self.pos] != "RBRACE":
             # Field name can be ID or KEYWORD
-            tok = self.peek()
-            if tok[0] in ("ID", "KEYWORD"):
-                field_name = self.consume()[1]
-            else:
-                raise ParseError(f"Expected field name, got {tok}")
-            self.consume("COLON")
+            field_name = self._expect_name("field name")
+            self._expect_type("COLON")
             # Type can be ID or KEYWORD
-            tok = self.peek()
-            if tok[0] in ("ID", "KEYWORD"):
-                field_type = self.consume()[1]
-            else:
-                raise ParseError(f"Expected type name, got {tok}")
+            field_type = self._expect_name("type name")
         
             fields.append((field_name, field_type))
         
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+                self._expect_type("COMMA")
 
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return UnionDef(name, fields)
     
     def typedef_union(self):
         """Parse typedef union definition"""
-        self.consume("KEYWORD", "typedef")
-        self.consume("KEYWORD", "union")
-        name = self.consume("ID")[1]
-        self.consume("LBRACE")
+        self._advance()  # 'typedef'
+        self._advance()  # 'union'
+        name = self._expect_type("ID")[1]
+        self._expect_type("LBRACE")
 
         fields = []
-        while self.peek()[0] != "RBRACE":
+        while self.types[self.pos] != "RBRACE":
             # Field name can be ID or KEYWORD
-            tok = self.peek()
-            if tok[0] in ("ID", "KEYWORD"):
-                field_name = self.consume()[1]
-            else:
-                raise ParseError(f"Expected field name, got {tok}")
-            self.consume("COLON")
+            field_name = self._expect_name("field name")
+            self._expect_type("COLON")
             # Type can be ID or KEYWORD
-            tok = self.peek()
-            if tok[0] in ("ID", "KEYWORD"):
-                field_type = self.consume()[1]
-            else:
-                raise ParseError(f"Expected type name, got {tok}")
+            field_type = self._expect_name("type name")
 
             fields.append((field_name, field_type))
 
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+                self._expect_type("COMMA")
 
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return TypedefUnion(name, fields)
 
     def struct_def(self):
         """Parse struct definition"""
-        self.consume("KEYWORD", "struct")
-        name = self.consume("ID")[1]
-        self.consume("LBRACE")
+        self._advance()  # 'struct'
+        name = self._expect_type("ID")[1]
+        self._expect_type("LBRACE")
     
         fields = []
-        while self.peek()[0] != "RBRACE":
+        while self.types[self.pos] != "RBRACE":
             # Check for anonymous union
-            if self.peek()[1] == "union":
-                self.consume("KEYWORD", "union")
-                self.consume("LBRACE")
+            if self.values[self.pos] == "union":
+                self._advance()  # 'union'
+                self._expect_type("LBRACE")
                 union_fields = []
-                while self.peek()[0] != "RBRACE":
+                while self.types[self.pos] != "RBRACE":
                     # Field name can be ID or KEYWORD
-                    tok = self.peek()
-                    if tok[0] in ("ID", "KEYWORD"):
-                        union_field_name = self.consume()[1]
-                    else:
-                        raise ParseError(f"Expected field name, got {tok}")
-                    self.consume("COLON")
+                    union_field_name = self._expect_name("field name")
+                    self._expect_type("COLON")
                     # Type can be ID or KEYWORD
-                    tok = self.peek()
-                    if tok[0] in ("ID", "KEYWORD"):
-                        union_field_type = self.consume()[1]
-                    else:
-                        raise ParseError(f"Expected type name, got {tok}")
+                    union_field_type = self._expect_name("type name")
                     union_fields.append((union_field_name, union_field_type))
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                self.consume("RBRACE")
+                    if self.types[self.pos] == "COMMA":
+                        self._expect_type("COMMA")
+                self._expect_type("RBRACE")
                 # Add anonymous union as a special field
                 fields.append(("__union__", AnonymousUnion(union_fields), None))
             else:
                 # Regular field - field name can be ID or KEYWORD
-                tok = self.peek()
-                if tok[0] in ("ID", "KEYWORD"):
-                    field_name = self.consume()[1]
-                else:
-                    raise ParseError(f"Expected field name, got {tok}")
-                self.consume("COLON")
+                field_name = self._expect_name("field name")
+                self._expect_type("COLON")
                 # Type can be ID or KEYWORD
-                tok = self.peek()
-                if tok[0] in ("ID", "KEYWORD"):
-                    field_type = self.consume()[1]
-                else:
-                    raise ParseError(f"Expected type name, got {tok}")
+                field_type = self._expect_name("type name")
 
                 default_value = None
-                if self.peek()[1] == "=":
-                    self.consume("OP", "=")
+                if self.values[self.pos] == "=":
+                    self._advance()  # '='
                     default_value = self.expr()
 
                 fields.append((field_name, field_type, default_value))
         
-            if self.peek()[0] == "COMMA":
-             self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+             self._expect_type("COMMA")
     
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return StructDef(name, fields)
 
     def enum_def(self):
         """Parse enum definition"""
-        self.consume("KEYWORD", "enum")
-        name = self.consume("ID")[1]
-        self.consume("LBRACE")
+        self._advance()  # 'enum'
+        name = self._expect_type("ID")[1]
+        self._expect_type("LBRACE")
         
         variants = []
-        while self.peek()[0] != "RBRACE":
-            variant_name = self.consume("ID")[1]
+        add_variant = variants.append
+        while self.types[self.pos] != "RBRACE":
+            variant_name = self._expect_type("ID")[1]
             
             associated_data = None
-            if self.peek()[0] == "LPAREN":
-                self.consume("LPAREN")
+            if self.types[self.pos] == "LPAREN":
+                self._expect_type("LPAREN")
                 associated_data = []
-                while self.peek()[0] != "RPAREN":
-                    associated_data.append(self.consume("ID")[1])
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                self.consume("RPAREN")
+                while self.types[self.pos] != "RPAREN":
+                    associated_data.append(self._expect_type("ID")[1])
+                    if self.types[self.pos] == "COMMA":
+                        self._expect_type("COMMA")
+                self._expect_type("RPAREN")
             
-            variants.append((variant_name, associated_data))
+            add_variant((variant_name, associated_data))
             
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if self.types[self.pos] == "COMMA":
+                self._expect_type("COMMA")
         
-        self.consume("RBRACE")
+        self._expect_type("RBRACE")
         return EnumDef(name, variants)
 
     def type_alias(self):
         """Parse type alias"""
-        self.consume("KEYWORD", "type")
-        name = self.consume("ID")[1]
-        self.consume("OP", "=")
-        type_expr = self.consume("ID")[1]
+        self._advance()  # 'type'
+        name = self._expect_type("ID")[1]
+        self._expect_value("=")
+        type_expr = self._expect_type("ID")[1]
         return TypeAlias(name, type_expr)
 
     def import_stmt(self):
         """Parse import statement with file path support"""
-        self.consume("KEYWORD", "import")
+        self._advance()  # 'import'
     
-        tok = self.peek()
+        tok_type = self.types[self.pos]
     
-        if tok[0] == "STRING":
+        if tok_type == "STRING":
             # import "file.zy" [as alias]
-            filepath = self.consume("STRING")[1].strip('"\'')
+            filepath = self._expect_type("STRING")[1].strip('"\'')
         
             alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
+            if self.values[self.pos] == "as":
+                self._advance()  # 'as'
+                alias = self._expect_type("ID")[1]
         
             return ImportStatement(filepath, names=None, alias=alias)
 
-        elif tok[0] == "ID":
+        elif tok_type == "ID":
             # Legacy: import module (assumes .zy extension)
-            module = self.consume("ID")[1]
+            module = self._expect_type("ID")[1]
 
             alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
+            if self.values[self.pos] == "as":
+                self._advance()  # 'as'
+                alias = self._expect_type("ID")[1]
 
             return ImportStatement(module + ".zy", names=None, alias=alias)
         
         else:
-            raise ParseError(f"Expected string or identifier after 'import', got {tok}")
+            raise ParseError(f"Expected string or identifier after 'import', got {self.peek()}")
 
     def function_def(self):
         """Parse function definition with enhanced features"""
         is_async = False
-        if self.peek()[1] == "async":
-            self.consume("KEYWORD", "async")
+        if self.values[self.pos] == "async":
+            self._advance()  # 'async'
             is_async = True
         
-        self.consume("KEYWORD", "fnc")
-        name = self.consume("ID")[1]
-        self.consume("LPAREN")
+        self._expect_value("fnc")
+        name = self._expect_type("ID")[1]
+        self._expect_type("LPAREN")
         
         params = []
-        while self.peek()[0] != "RPAREN":
+        append = params.append
+        types = self.types
+        expect_type = self._expect_type
+        while types[self.pos] != "RPAREN":
             param_type = None
             
-            # Type annotation
-            if self.peek(1)[0] == "ID" and self.peek(1)[1] not in ("=", ",", ")"):
-                param_type = self.consume("ID")[1]
+            # Type annotation: two names in a row
+            if types[self.pos + 1] == "ID":
+                param_type = expect_type("ID")[1]
             
-            param_name = self.consume("ID")[1]
+            param_name = expect_type("ID")[1]
             
             # Default value
             default_value = None
-            if self.peek()[1] == "=":
-                self.consume("OP", "=")
+            if self.values[self.pos] == "=":
+                self.pos += 1
                 default_value = self.expr()
             
-            params.append((param_type, param_name, default_value))
+            append((param_type, param_name, default_value))
             
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
+            if types[self.pos] == "COMMA":
+                self.pos += 1
         
-        self.consume("RPAREN")
+        self._expect_type("RPAREN")
         
         # Return type annotation
         return_type = None
-        if self.peek()[0] == "OP" and self.peek()[1] == "->":
-            self.consume("OP", "->")
-            return_type = self.consume("ID")[1]
+        if self.values[self.pos] == "->":
+            self._advance()  # '->'
+            return_type = self._expect_type("ID")[1]
         
         body = self.block()
         return FunctionDef(name, params, body, return_type, is_async)
 
     def print_stmt(self):
         """Parse print statement"""
-        self.consume("KEYWORD", "print")
-        self.consume("LPAREN")
+        self._advance()  # 'print'
+        self._expect_type("LPAREN")
         expr = self.expr()
-        self.consume("RPAREN")
+        self._expect_type("RPAREN")
         return PrintStatement(expr)
     
     def printf_stmt(self):
         """Parse printf statement"""
-        self.consume("KEYWORD", "printf")
-        self.consume("LPAREN")
+        self._advance()  # 'printf'
+        self._expect_type("LPAREN")
         format_expr = self.expr()
         args = []
-        while self.peek()[0] == "COMMA":
-            self.consume("COMMA")
-            args.append(self.expr())
-        self.consume("RPAREN")
+        append = args.append
+        while self.types[self.pos] == "COMMA":
+            self._expect_type("COMMA")
+            append(self.expr())
+        self._expect_type("RPAREN")
         return PrintfStatement(format_expr, args)
 
     # ===== Expression Parsing =====
 
-    def expr(self):
-        """Parse expression starting from lowest precedence"""
-        return self.ternary()
-
-    def ternary(self):
-        """Parse ternary operator: condition ? true_val : false_val"""
-        expr = self.logic_or()
-        if self.peek()[1] == "?":
-            self.consume("OP", "?")
+    def expr(self, first=None):
+        """Parse expression starting from lowest precedence, including the
+        ternary operator: condition ? true_val : false_val
+
+        first is an operand the caller has already parsed; the expression
+        then continues from the token after it."""
+        expr = self.unary() if first is None else first
+        # Most operands aren't followed by an operator; only build the
+        # operator stack when one is
+        if self.values[self.pos] in PRECEDENCE:
+            expr = self._binop(expr)
+        if self.values[self.pos] == "?":
+            self._advance()  # '?'
             true_val = self.expr()
-            self.consume("COLON")
+            self._expect_type("COLON")
             false_val = self.expr()
             return TernaryOp(expr, true_val, false_val)
         return expr
 
-    def logic_or(self):
-        """Parse logical OR and XOR"""
-        left = self.logic_and()
-        while self.peek()[1] in ["or", "xor", "||"]:
-            op = self.consume()[1]
-            if op == "||":
-                op = "or"
-            right = self.logic_and()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def logic_and(self):
-        """Parse logical AND"""
-        left = self.logic_then()
-        while self.peek()[1] in ["and", "&&"]:
-            op = self.consume()[1]
-            if op == "&&":
-                op = "and"
-            right = self.logic_then()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def logic_then(self):
-        """Parse logical implication"""
-        left = self.logic_nand()
-        while self.peek()[1] == "then":
-            op = self.consume()[1]
-            right = self.logic_nand()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def logic_nand(self):
-        """Parse NAND"""
-        left = self.comparison()
-        while self.peek()[1] == "nand":
-            op = self.consume()[1]
-            right = self.comparison()
-            left = BinaryOp(left, op, right)
-        return left
-    
-    def comparison(self):
-        """Parse comparison operators"""
-        left = self.bitwise_or()
-        while self.peek()[1] in ["==", "!=", "<", ">", "<=", ">=", "in", "<=>", "===", "!=="]:
-            op = self.consume()[1]
-            right = self.bitwise_or()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def bitwise_or(self):
-        """Parse bitwise OR"""
-        left = self.bitwise_xor()
-        while self.peek()[1] == "|":
-            op = self.consume()[1]
-            right = self.bitwise_xor()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def bitwise_xor(self):
-        """Parse bitwise XOR"""
-        left = self.bitwise_and()
-        while self.peek()[1] == "^":
-            op = self.consume()[1]
-            right = self.bitwise_and()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def bitwise_and(self):
-        """Parse bitwise AND"""
-        left = self.shift()
-        while self.peek()[1] == "&":
-            op = self.consume()[1]
-            right = self.shift()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def shift(self):
-        """Parse bit shift operators"""
-        left = self.range_expr()
-        while self.peek()[1] in ["<<", ">>"]:
-            op = self.consume()[1]
-            right = self.range_expr()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def range_expr(self):
-        """Parse range expressions: 1..10 or 1..=10"""
-        left = self.addition()
-        if self.peek()[1] == "..":
-            self.consume("OP", "..")
-            inclusive = False
-            if self.peek()[1] == "=":
-                self.consume("OP", "=")
-                inclusive = True
-            right = self.addition()
-            return RangeLiteral(left, right, inclusive)
-        elif self.peek()[1] == "..=":
-            self.consume()
-            right = self.addition()
-            return RangeLiteral(left, right, inclusive=True)
-        return left
-
-    def addition(self):
-        """Parse addition and subtraction"""
-        left = self.multiplication()
-        while self.peek()[1] in ("+", "-"):
-            op = self.consume()[1]
-            right = self.multiplication()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def multiplication(self):
-        """Parse multiplication, division, and modulo"""
-        left = self.power()
-        while self.peek()[1] in ("*", "/", "%", "//"):
-            op = self.consume()[1]
-            right = self.power()
-            left = BinaryOp(left, op, right)
-        return left
-
-    def power(self):
-        """Parse exponentiation (right-associative)"""
-        left = self.unary()
-        if self.peek()[1] == "**":
-            op = self.consume()[1]
-            right = self.power()  # Right-associative
-            return BinaryOp(left, op, right)
-        return left
+    def _binop(self, first):
+        """Parse binary operators (see PRECEDENCE) following the operand
+        first, with an explicit operator stack instead of one recursive
+        call per precedence level"""
+        values = self.values
+        unary = self.unary
+        reduce = self._reduce_binop
+        operands = [first]
+        pending = []  # (precedence, operator) not yet applied
+        push_operand = operands.append
+        push_op = pending.append
+
+        while True:
+            op = values[self.pos]
+            prec = PRECEDENCE.get(op)
+            if prec is None:
+                break
+
+            # Apply everything that binds tighter. Equal precedence groups
+            # to the left, except that ** is right-associative and ranges
+            # don't chain at all.
+            while pending and pending[-1][0] > prec:
+                reduce(operands, pending)
+            if pending and pending[-1][0] == prec:
+                if prec == RANGE_PREC:
+                    raise ParseError("Range expressions cannot be chained",
+                                     self._current_token())
+                if prec != POWER_PREC:
+                    reduce(operands, pending)
+            self.pos += 1
+
+            # Ranges: 1..10 or 1..=10
+            if prec == RANGE_PREC:
+                if op == ".." and values[self.pos] == "=":
+                    self.pos += 1
+                    op = "..="
+
+            push_op((prec, op))
+            push_operand(unary())
+
+        while pending:
+            reduce(operands, pending)
+        return operands[0]
+
+    @staticmethod
+    def _reduce_binop(operands, pending):
+        """Combine the top two operands with the most recent operator"""
+        prec, op = pending.pop()
+        right = operands.pop()
+        left = operands.pop()
+        if prec == RANGE_PREC:
+            operands.append(RangeLiteral(left, right, op == "..="))
+            return
+        op = OP_ALIASES.get(op, op)
+        if op in CHAIN_OPS:
+            # Runs of the same operator become one n-ary node
+            left_type = type(left)
+            if left_type is BinaryChain and left.op == op:
+                left.operands.append(right)
+                operands.append(left)
+                return
+            if left_type is BinaryOp and left.op == op:
+                operands.append(BinaryChain(op, [left.left, left.right, right]))
+                return
+        operands.append(BinaryOp(left, op, right))
 
     def unary(self):
         """Parse unary operators"""
-        tok = self.peek()
-
-        if tok[0] == "OP" and tok[1] in ("+", "-", "~", "!"):
-            op = self.consume()[1]
-            if op == "!":
-                op = "not"
-            expr = self.unary()
-            return UnaryOp(op, expr)
-
-        if tok[1] == "not":
-            self.consume()
-            expr = self.unary()
-            return UnaryOp("not", expr)
-        
-        # Increment/decrement operators
-        if tok[1] in ("++", "--"):
-            op = self.consume()[1]
-            expr = self.unary()
-            return UnaryOp(op, expr)
-        
-        # await keyword
-        if tok[1] == "await":
-            self.consume("KEYWORD", "await")
-            expr = self.unary()
-            return AwaitExpr(expr)
-
-        return self.postfix()
+        values = self.values
+        pos = self.pos
+        tok_val = values[pos]
+        if tok_val not in PREFIX_OPS and tok_val != "await":
+            return self.postfix()
+
+        # Collect the whole run of prefix operators (- - x, not not x,
+        # await f()) and parse the operand once instead of recursing per
+        # operator; None marks an await
+        prefixes = []
+        while True:
+            op = PREFIX_OPS.get(tok_val)
+            if op is None and tok_val != "await":
+                break
+            prefixes.append(op)
+            pos += 1
+            tok_val = values[pos]
+        self.pos = pos
+
+        expr = self.postfix()
+        for op in reversed(prefixes):
+            expr = AwaitExpr(expr) if op is None else UnaryOp(op, expr)
+        return expr
 
     def postfix(self):
         """Parse postfix operations (member access, indexing, calls)"""
-        expr = self.primary()
+        # Same dispatch as primary(), inlined to save a frame per operand
+        handler = self._PRIMARY_DISPATCH.get(self.types[self.pos])
+        if handler is None:
+            raise ParseError(f"Unexpected token in primary(): {self.peek()}")
+        expr = handler(self)
+        types = self.types
+        values = self.values
         
         while True:
-            tok = self.peek()
+            pos = self.pos
+            tok_type = types[pos]
             
             # Member access: obj.field
-            if tok[0] == "DOT":
-                self.consume("DOT")
+            if tok_type == "DOT":
+                self.pos = pos + 1
                 # Member name can be ID or KEYWORD (e.g., "type")
-                tok = self.peek()
-                if tok[0] in ("ID", "KEYWORD"):
-                    member = self.consume()[1]
-                else:
-                    raise ParseError(f"Expected member name, got {tok}")
+                member = self._expect_name("member name")
                 
                 # Method call
-                if self.peek()[0] == "LPAREN":
-                    self.consume("LPAREN")
-                    args = []
-                    while self.peek()[0] != "RPAREN":
-                        args.append(self.expr())
-                        if self.peek()[0] == "COMMA":
-                            self.consume("COMMA")
-                    self.consume("RPAREN")
-                    expr = FunctionCall(MemberAccess(expr, member), args)
+                if types[self.pos] == "LPAREN":
+                    args, kwargs = self._parse_call_args()
+                    expr = FunctionCall(MemberAccess(expr, member), args, kwargs)
                 else:
                     expr = MemberAccess(expr, member)
             
             # Array/dict indexing: expr[index]
-            elif tok[0] == "LBRACKET":
-                self.consume("LBRACKET")
-                
-                # Check for slicing: [start:end:step]
-                start = self.expr() if self.peek()[0] != "COLON" else None
-                
-                if self.peek()[0] == "COLON":
-                    self.consume("COLON")
-                    end = self.expr() if self.peek()[0] not in ("COLON", "RBRACKET") else None
-                    step = None
-                    if self.peek()[0] == "COLON":
-                        self.consume("COLON")
-                        step = self.expr()
-                    self.consume("RBRACKET")
-                    expr = SliceAccess(expr, start, end, step)
-                else:
-                    self.consume("RBRACKET")
-                    expr = IndexAccess(expr, start)
+            elif tok_type == "LBRACKET":
+                expr = self._index_suffix(expr)
             
             # Postfix increment/decrement
-            elif tok[1] in ("++", "--"):
-                op = self.consume()[1]
-                expr = UnaryOp(op + "_post", expr)
+            elif values[pos] in INCDEC_OPS:
+                self.pos = pos + 1
+                expr = UnaryOp(values[pos] + "_post", expr)
             
             else:
                 break
         
         return expr
 
-    def primary(self):
-        """Parse primary expressions"""
-        tok = self.peek()
-
-        # Grouped expression or tuple
-        if tok[0] == "LPAREN":
-            start_pos = self.pos
-            self.consume("LPAREN")
-            
-            # Empty tuple
-            if self.peek()[0] == "RPAREN":
-                self.consume("RPAREN")
-                return TupleLiteral([])
-            
-            # Parse first element
-            first = self.expr()
-            
-            # Single element with comma = 1-tuple
-            if self.peek()[0] == "COMMA":
-                elements = [first]
-                while self.peek()[0] == "COMMA":
-                    self.consume("COMMA")
-                    if self.peek()[0] == "RPAREN":  # Trailing comma
-                        break
-                    elements.append(self.expr())
-                self.consume("RPAREN")
-                return TupleLiteral(elements)
-            # No comma = grouped expression
-            else:
-                self.consume("RPAREN")
-                return first
-
-        # Numbers
-        elif tok[0] == "NUMBER":
-            self.consume()
-            value = int(tok[1]) if "." not in tok[1] else float(tok[1])
-            return Literal(value)
+    def _index_suffix(self, expr):
+        """Parse an index or slice applied to expr: expr[i], expr[a:b:c]"""
+        if self.no_struct_literal:
+            return self._allow_struct_literals(self._index_suffix, expr)
+        self.pos += 1  # '['
+        types = self.types
         
-        elif tok[0] == "FLOAT":
-            self.consume()
-            return Literal(float(tok[1]))
+        # Check for slicing: [start:end:step]
+        start = self.expr() if types[self.pos] != "COLON" else None
         
-        elif tok[0] in ("INT_HEX", "INT_OCTAL", "INT_BINARY"):
-            self.consume()
-            value = int(tok[1], 0)  # Auto-detect base
-            return Literal(value)
+        if types[self.pos] == "COLON":
+            self._expect_type("COLON")
+            end = self.expr() if types[self.pos] not in SLICE_END_TYPES else None
+            step = None
+            if types[self.pos] == "COLON":
+                self._expect_type("COLON")
+                step = self.expr()
+            self._expect_type("RBRACKET")
+            return SliceAccess(expr, start, end, step)
+        self._expect_type("RBRACKET")
+        return IndexAccess(expr, start)
 
-        # Arrays
-        elif tok[0] == "LBRACKET":
-            return self.array_literal()
-        
-        # Dictionaries and sets
-        elif tok[0] == "LBRACE":
-            # Look ahead to distinguish dict from set
-            if self.peek(1)[0] == "RBRACE":
-                # Empty dict {}
-                self.consume("LBRACE")
-                self.consume("RBRACE")
-                return DictLiteral([])
-            elif self.peek(2)[0] == "COLON":
-                return self.dict_literal()
-            else:
-                return self.set_literal()
-
-        # Literals
-        elif tok[0] == "BOOL":
-            self.consume()
-            return Literal(True if tok[1] == "true" else False)
-        
-        elif tok[0] == "NULL":
-            self.consume("NULL")
-            return NullLiteral()
-        
-        elif tok[0] == "STRING":
-            self.consume()
-            return Literal(tok[1].strip('"'))
-        
-        elif tok[0] == "STRING_INTERP":
-            return self.string_interpolation(tok[1])
+    def primary(self):
+        """Parse primary expressions"""
+        handler = self._PRIMARY_DISPATCH.get(self.types[self.pos])
+        if handler is None:
+            raise ParseError(f"Unexpected token in primary(): {self.peek()}")
+        return handler(self)
+
+    def group_or_tuple(self):
+        """Parse grouped expression or tuple"""
+        if self.no_struct_literal:
+            return self._allow_struct_literals(self.group_or_tuple)
+        self.pos += 1  # '('
+        types = self.types
         
-        elif tok[0] == "CHAR":
-            self.consume()
-            return CharLiteral(tok[1][1:-1])
+        # Empty tuple
+        if types[self.pos] == "RPAREN":
+            self.pos += 1
+            return TupleLiteral([])
         
-        elif tok[0] == "BIGINT":
-            self.consume("BIGINT")
-            return BigIntLiteral(tok[1])
+        # Parse first element
+        first = self.expr()
         
-        elif tok[0] == "DECIMAL":
-            self.consume()
-            return DecimalLiteral(tok[1][:-1])
+        # Single element with comma = 1-tuple
+        if types[self.pos] == "COMMA":
+            elements = [first]
+            append = elements.append
+            expr = self.expr
+            while types[self.pos] == "COMMA":
+                self.pos += 1
+                if types[self.pos] == "RPAREN":  # Trailing comma
+                    break
+                append(expr())
+            self._expect_type("RPAREN")
+            return TupleLiteral(elements)
+        # No comma = grouped expression
+        else:
+            self._expect_type("RPAREN")
+            return first
+
+    def scalar_literal(self):
+        """Parse number, bool and string literals.
+
+        Literal nodes are immutable, so every occurrence of the same token
+        shares one node.
+        """
+        tok = self._advance()
+        lit = self.literal_cache.get(tok)
+        if lit is None:
+            lit = self.literal_cache[tok] = Literal(LITERAL_CONVERTERS[tok[0]](tok[1]))
+        return lit
+
+    def brace_literal(self):
+        """Parse dict or set literal"""
+        if self.no_struct_literal:
+            return self._allow_struct_literals(self.brace_literal)
+        # Look ahead to distinguish dict from set
+        pos = self.pos
+        types = self.types
+        if types[pos + 1] == "RBRACE":
+            # Empty dict {}
+            self.pos = pos + 2
+            return DictLiteral([])
+        elif types[pos + 2] == "COLON":
+            return self.dict_literal()
+        else:
+            return self.set_literal()
 
-        # Type constructors
-        elif tok[0] == "ID" and tok[1] in ("int8", "int16", "int32", "int64", "int128", "int256"):
-            typename = self.consume("ID")[1]
-            self.consume("LPAREN")
-            inner_expr = self.expr()
-            self.consume("RPAREN")
-            bit_size = int(typename[3:])
-            return IntLiteral(inner_expr, bit_size, signed=True)
-        
-        elif tok[0] == "ID" and tok[1] in ("uint8", "uint16", "uint32", "uint64", "uint128", "uint256"):
-            typename = self.consume("ID")[1]
-            self.consume("LPAREN")
-            inner_expr = self.expr()
-            self.consume("RPAREN")
-            bit_size = int(typename[4:])
-            return UIntLiteral(inner_expr, bit_size)
+    def null_literal(self):
+        """Parse null"""
+        self._expect_type("NULL")
+        return NullLiteral()
 
-        elif tok[0] == "ID" and tok[1] in ("usize", "isize"):
-            typename = self.consume("ID")[1]
-            self.consume("LPAREN")
-            inner_expr = self.expr()
-            self.consume("RPAREN")
-            return SizeIntLiteral(inner_expr, signed=(typename == "isize"))
+    def interp_string_literal(self):
+        """Parse f-string literal"""
+        return self.string_interpolation(self._expect_type("STRING_INTERP")[1])
 
-        elif tok[0] == "ID" and tok[1] == "ptrdiff":
-            self.consume("ID")
-            self.consume("LPAREN")
-            inner_expr = self.expr()
-            self.consume("RPAREN")
-            return PtrDiffLiteral(inner_expr)
+    def char_literal(self):
+        """Parse character literal"""
+        return CharLiteral(self._advance()[1][1:-1])
 
+    def bigint_literal(self):
+        """Parse bigint literal: 123n"""
+        return BigIntLiteral(self._expect_type("BIGINT")[1])
+
+    def decimal_literal(self):
+        """Parse decimal literal: 12.5d"""
+        return DecimalLiteral(self._advance()[1][:-1])
+
+    def op_primary(self):
+        """Parse expressions that start with an operator"""
         # Lambda expressions: |x, y| x + y
-        elif tok[0] == "OP" and tok[1] == "|":
+        if self.values[self.pos] == "|":
             return self.lambda_expr()
+        raise ParseError(f"Unexpected token in primary(): {self.peek()}")
+
+    def identifier_expr(self):
+        """Parse identifiers, type constructors, calls and struct literals"""
+        # Only reached through _PRIMARY_DISPATCH, so the token is an ID
+        pos = self.pos
+        name = self.values[pos]
+        self.pos = pos + 1
+
+        # Type constructors
+        ctor = TYPED_CTORS.get(name)
+        if ctor is not None:
+            self._expect_type("LPAREN")
+            inner_expr = self.expr()
+            self._expect_type("RPAREN")
+            node_class, extra_args = ctor
+            return node_class(inner_expr, *extra_args)
 
         # Identifiers and function calls
-        elif tok[0] == "ID":
-            name = self.consume("ID")[1]
-            
-            # Function call
-            if self.peek()[0] == "LPAREN":
-                self.consume("LPAREN")
-                args = []
-                kwargs = {}
-                
-                while self.peek()[0] != "RPAREN":
-                    # Named argument: name = value (name can be ID or KEYWORD)
-                    if self.peek()[0] in ("ID", "KEYWORD") and self.peek(1)[1] == "=":
-                        arg_name = self.consume()[1]
-                        self.consume("OP", "=")
-                        kwargs[arg_name] = self.expr()
-                    else:
-                        args.append(self.expr())
-                    
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                
-                self.consume("RPAREN")
-                return FunctionCall(name, args, kwargs)
-            
-            # Struct literal: Person { name: "Alice", age: 30 }
-            elif self.peek()[0] == "LBRACE":
-                self.consume("LBRACE")
-                fields = {}
-                while self.peek()[0] != "RBRACE":
-                    # Field name can be ID or KEYWORD (e.g., "type")
-                    tok = self.peek()
-                    if tok[0] in ("ID", "KEYWORD"):
-                        field_name = self.consume()[1]
-                    else:
-                        raise ParseError(f"Expected field name, got {tok}")
-                    self.consume("COLON")
-                    field_value = self.expr()
-                    fields[field_name] = field_value
-                    if self.peek()[0] == "COMMA":
-                        self.consume("COMMA")
-                self.consume("RBRACE")
-                return StructLiteral(name, fields)
-            
-            else:
-                return Identifier(name)
+        types = self.types
+        next_type = types[pos + 1]
 
-        else:
-            raise ParseError(f"Unexpected token in primary(): {tok}")
+        # Function call
+        if next_type == "LPAREN":
+            args, kwargs = self._parse_call_args()
+            return FunctionCall(name, args, kwargs)
+        
+        # Struct literal: Person { name: "Alice", age: 30 }
+        elif next_type == "LBRACE" and not self.no_struct_literal:
+            self.pos = pos + 2
+            fields = {}
+            expect_type = self._expect_type
+            while types[self.pos] != "RBRACE":
+                # Field name can be ID or KEYWORD (e.g., "type")
+                field_name = self._expect_name("field name")
+                expect_type("COLON")
+                fields[field_name] = self.expr()
+                if types[self.pos] == "COMMA":
+                    self.pos += 1
+            expect_type("RBRACE")
+            return StructLiteral(name, fields)
+        
+        ident = self.identifier_cache.get(name)
+        if ident is None:
+            ident = self.identifier_cache[name] = Identifier(name)
+        return ident
+
+    def _parse_call_args(self):
+        """Parse a parenthesized call argument list into (args, kwargs)"""
+        if self.no_struct_literal:
+            return self._allow_struct_literals(self._parse_call_args)
+        self._expect_type("LPAREN")
+        types = self.types
+        values = self.values
+        expr = self.expr
+
+        # Fast paths for the common f() and f(x) shapes
+        pos = self.pos
+        if types[pos] == "RPAREN":
+            self.pos = pos + 1
+            return (), {}
+        args = []
+        if not (types[pos] in NAME_TYPES and values[pos + 1] == "="):
+            args.append(expr())
+            if types[self.pos] == "RPAREN":
+                self.pos += 1
+                return args, {}
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+
+        append = args.append
+        kwargs = {}
+        while types[self.pos] != "RPAREN":
+            # Named argument: name = value (name can be ID or KEYWORD)
+            pos = self.pos
+            if types[pos] in NAME_TYPES and values[pos + 1] == "=":
+                self.pos = pos + 2
+                kwargs[values[pos]] = expr()
+            else:
+                append(expr())
+            
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+        
+        self._expect_type("RPAREN")
+        return args, kwargs
 
     def lambda_expr(self):
         """Parse lambda expression: |x, y| x + y"""
-        self.consume("OP", "|")
+        self.pos += 1  # '|'
         params = []
-        while self.peek()[0] != "OP" or self.peek()[1] != "|":
-            params.append(self.consume("ID")[1])
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
-        self.consume("OP", "|")
+        types = self.types
+        values = self.values
+        expect_type = self._expect_type
+        while values[self.pos] != "|":
+            params.append(expect_type("ID")[1])
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+        self.pos += 1  # closing '|'
         body = self.expr()
         return LambdaExpr(params, body)
 
@@ -1212,41 +1272,101 @@ class Parser:
 
     def array_literal(self):
         """Parse array literal"""
-        self.consume("LBRACKET")
+        if self.no_struct_literal:
+            return self._allow_struct_literals(self.array_literal)
+        self._expect_type("LBRACKET")
         elements = []
-        while self.peek()[0] != "RBRACKET":
-            elements.append(self.expr())
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
-        self.consume("RBRACKET")
+        append = elements.append
+        types = self.types
+        expr = self.expr
+        while types[self.pos] != "RBRACKET":
+            append(expr())
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+        self._expect_type("RBRACKET")
         return ArrayLiteral(elements)
     
     def dict_literal(self):
         """Parse dictionary literal"""
-        self.consume("LBRACE")
+        self._expect_type("LBRACE")
         pairs = []
-        while self.peek()[0] != "RBRACE":
-            key = self.expr()
-            self.consume("COLON")
-            value = self.expr()
-            pairs.append((key, value))
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
-        self.consume("RBRACE")
+        append = pairs.append
+        types = self.types
+        expr = self.expr
+        expect_type = self._expect_type
+        while types[self.pos] != "RBRACE":
+            key = expr()
+            expect_type("COLON")
+            value = expr()
+            append((key, value))
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+        self._expect_type("RBRACE")
         return DictLiteral(pairs)
 
     def set_literal(self):
         """Parse set literal"""
-        self.consume("LBRACE")
+        self._expect_type("LBRACE")
         elements = []
-        while self.peek()[0] != "RBRACE":
-            elements.append(self.expr())
-            if self.peek()[0] == "COMMA":
-                self.consume("COMMA")
-        self.consume("RBRACE")
+        append = elements.append
+        types = self.types
+        expr = self.expr
+        while types[self.pos] != "RBRACE":
+            append(expr())
+            if types[self.pos] == "COMMA":
+                self.pos += 1
+        self._expect_type("RBRACE")
         return SetLiteral(elements)
 
     def tuple_literal(self):
         """Parse tuple literal (handled in primary now)"""
         # This is kept for compatibility but primary() handles it
-        return self.primary()
\ No newline at end of file
+        return self.primary()
+
+    # Statement keyword -> parse method, used by statement()
+    _STMT_DISPATCH = {
+        "const": const_decl,
+        "if": if_stmt,
+        "while": while_stmt,
+        "for": for_stmt,
+        "print": print_stmt,
+        "printf": printf_stmt,
+        "fnc": function_def,
+        "async": function_def,
+        "return": keyword_stmt,
+        "break": keyword_stmt,
+        "continue": continue_stmt,
+        "switch": switch_stmt,
+        "match": match_stmt,
+        "try": try_catch_stmt,
+        "throw": keyword_stmt,
+        "typedef": typedef_stmt,
+        "union": union_def,
+        "struct": struct_def,
+        "enum": enum_def,
+        "type": type_alias,
+        "from": from_import_stmt,
+        "import": import_stmt,
+        "yield": keyword_stmt,
+    }
+
+    # Token type -> parse method, used by primary()
+    _PRIMARY_DISPATCH = {
+        "LPAREN": group_or_tuple,
+        "NUMBER": scalar_literal,
+        "FLOAT": scalar_literal,
+        "INT_HEX": scalar_literal,
+        "INT_OCTAL": scalar_literal,
+        "INT_BINARY": scalar_literal,
+        "LBRACKET": array_literal,
+        "LBRACE": brace_literal,
+        "BOOL": scalar_literal,
+        "NULL": null_literal,
+        "STRING": scalar_literal,
+        "STRING_INTERP": interp_string_literal,
+        "CHAR": char_literal,
+        "BIGINT": bigint_literal,
+        "DECIMAL": decimal_literal,
+        "OP": op_primary,
+        "ID": identifier_expr,
+    }
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Test runner for import system
-Place this file in the same directory as your tokenizer_enhanced.py and ast_nodes_enhanced.py
+Place this file in the same directory as lexer.py and parser_enhanced.py
 """
 
 import sys
@@ -11,105 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from lexer import tokenize
-from ast_nodes_enhanced import *
-
-# Simple parser with just import support for testing
-class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.pos = 0
-
-    def peek(self, offset=0):
-        """Peek ahead at tokens"""
-        idx = self.pos + offset
-        if idx < len(self.tokens):
-            token = self.tokens[idx]
-            return (token.type, token.value) if hasattr(token, 'type') else token
-        return (None, None)
-
-    def consume(self, expected_type=None, expected_value=None):
-        """Consume a token with optional validation"""
-        tok = self.peek()
-        if expected_type and tok[0] != expected_type:
-            raise Exception(f"Expected {expected_type}, got {tok[0]}")
-        if expected_value and tok[1] != expected_value:
-            raise Exception(f"Expected '{expected_value}', got '{tok[1]}'")
-        self.pos += 1
-        return tok
-
-    def parse(self):
-        """Parse entire program"""
-        statements = []
-        while self.peek()[0] is not None:
-            statements.append(self.statement())
-        return Program(statements)
-
-    def statement(self):
-        """Parse a single statement"""
-        tok = self.peek()
-        keyword = tok[1] if tok[0] == "KEYWORD" else None
-        
-        # Handle 'from X import Y' syntax
-        if keyword == "from":
-            return self.from_import_stmt()
-        elif keyword == "import":
-            return self.import_stmt()
-        
-        # Placeholder for other statements
-        return Literal(None)
-
-    def import_stmt(self):
-        """Parse import statement with file path support"""
-        self.consume("KEYWORD", "import")
-        
-        tok = self.peek()
-        
-        if tok[0] == "STRING":
-            filepath = self.consume("STRING")[1].strip('"\'')
-            
-            alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
-            
-            return ImportStatement(filepath, names=None, alias=alias)
-        
-        elif tok[0] == "ID":
-            module = self.consume("ID")[1]
-            
-            alias = None
-            if self.peek()[1] == "as":
-                self.consume("KEYWORD", "as")
-                alias = self.consume("ID")[1]
-            
-            return ImportStatement(module + ".zy", names=None, alias=alias)
-        
-        else:
-            raise Exception(f"Expected string or identifier after 'import', got {tok}")
-
-    def from_import_stmt(self):
-        """Parse 'from X import Y' statement"""
-        self.consume("KEYWORD", "from")
-        
-        tok = self.peek()
-        if tok[0] == "STRING":
-            filepath = self.consume("STRING")[1].strip('"\'')
-        elif tok[0] == "ID":
-            filepath = self.consume("ID")[1] + ".zy"
-        else:
-            raise Exception(f"Expected string or identifier after 'from', got {tok}")
-        
-        self.consume("KEYWORD", "import")
-        
-        names = []
-        while True:
-            names.append(self.consume("ID")[1])
-            if self.peek()[0] != "COMMA":
-                break
-            self.consume("COMMA")
-        
-        return ImportStatement(filepath, names=names, alias=None)
-
+from parser_enhanced import Parser
 
 # Test cases
 if __name__ == "__main__":